@@ -16,7 +16,6 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import os
 import sys
 from typing import Optional
@@ -24,15 +23,26 @@ from typing import Optional
 from dotenv import load_dotenv
 from beeai_framework.backend import UserMessage  # type: ignore
 
-from a2a_universal.adapters.beeai_agent import make_beeai_agent, preflight_readyz
+from a2a_universal.adapters.beeai_agent import make_beeai_agent
+from a2a_universal.examples_common import readyz, run
+
+
+def _preflight_readyz(base_url: str) -> None:
+    """Warn if the server runs the CrewAI framework; the probe result is cached for 30s."""
+    probe = readyz(base_url)
+    if probe and probe[0] == 200 and b"crewai" in probe[1].lower():
+        print("[WARN] A2A server looks configured for CrewAI. "
+              "Run it with AGENT_FRAMEWORK=native for the BeeAI agent.")
 
 
 async def main(prompt: Optional[str] = None) -> None:
     load_dotenv()
     base_url = os.getenv("A2A_BASE_URL", "http://localhost:8000").rstrip("/")
 
-    # Best-effort preflight (warn if server is running CrewAI framework)
-    preflight_readyz(base_url, context="BeeAI agent")
+    # Best-effort preflight (warn if server is running CrewAI framework); the
+    # adapter's own uncached probe is switched off so it doesn't run twice.
+    _preflight_readyz(base_url)
+    os.environ.setdefault("BEEAI_PREFLIGHT", "false")
 
     agent = make_beeai_agent(base_url)
 
@@ -56,4 +66,4 @@ async def main(prompt: Optional[str] = None) -> None:
 
 if __name__ == "__main__":
     arg = sys.argv[1] if len(sys.argv) > 1 else None
-    asyncio.run(main(arg))
+    run(main(arg))
@@ -1,31 +1,18 @@
-import httpx, os, sys
+import sys
+from functools import lru_cache
 
-BASE = os.getenv("A2A_BASE", "http://localhost:8000")
+from a2a_universal.examples_common import A2ACallError, send_sync
+
+# Repeated identical prompts are answered in-process; failures raise inside the
+# cached call and are therefore never memoized.
+_send_cached = lru_cache(maxsize=1024)(send_sync)
 
 def call_a2a(text: str) -> str:
-    payload = {
-        "method": "message/send",
-        "params": {
-            "message": {
-                "role": "user",
-                "messageId": "poc",
-                "parts": [{"type": "text", "text": text}],
-            }
-        },
-    }
+    """Send *text* to the A2A server (A2A_BASE, default http://localhost:8000)."""
     try:
-        r = httpx.post(f"{BASE}/a2a", json=payload, timeout=30.0)
-        r.raise_for_status()
-    except httpx.ConnectError:
-        return f"[Error] Could not connect to A2A server at {BASE}. Did you run `make run`?"
-    except httpx.HTTPStatusError as e:
-        return f"[Error] Server returned {e.response.status_code}: {e.response.text}"
-
-    data = r.json()
-    for p in (data.get("message") or {}).get("parts", []):
-        if p.get("type") == "text":
-            return p.get("text", "")
-    return "[No text part in A2A response]"
+        return _send_cached(text)
+    except A2ACallError as e:
+        return str(e)
 
 if __name__ == "__main__":
-    print(call_a2a("What is the best dish in Genova?"))
+    print(call_a2a(" ".join(sys.argv[1:]) or "What is the best dish in Genova?"))
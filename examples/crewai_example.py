@@ -1,30 +1,57 @@
 # examples/crewai_example.py
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
-# Load environment variables FIRST, before importing any local modules that use them.
-from dotenv import load_dotenv
-load_dotenv()
+# Step-by-step CrewAI console output is opt-in: A2A_VERBOSE=1
+VERBOSE = os.getenv("A2A_VERBOSE", "").strip().lower() in {"1", "true", "yes", "y"}
 
 
-from crewai import Agent, Task, Crew
+def _start_log_listener() -> QueueListener:
+    """Route crewai logs through a queue so formatting and tty writes happen off the agent thread."""
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    try:
+        from rich.console import Console
+        from rich.logging import RichHandler
 
-from a2a_universal.provider_api import crew_llm   # <-- import directly from provider_api
-from a2a_universal.adapters.crewai_tool import A2ATool
-from a2a_universal.provider_api import llm as model  # auto-chooses CrewAI LLM by env
+        handler: logging.Handler = RichHandler(console=Console(soft_wrap=False, no_color=True))
+    except ImportError:
+        handler = logging.StreamHandler()
+    log = logging.getLogger("crewai")
+    log.addHandler(QueueHandler(q))
+    log.propagate = False
+    listener = QueueListener(q, handler)
+    listener.start()
+    return listener
+
+
+async def main() -> None:
+    # Heavy imports (crewai pulls in litellm and friends) are deferred until the
+    # script actually runs, so importing this module or failing early stays cheap.
+    # Load environment variables FIRST, before importing any local modules that use them.
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from crewai import Agent, Task, Crew
+
+    from a2a_universal.adapters.crewai_tool import A2ATool
+    from a2a_universal.provider_api import llm as model  # auto-chooses CrewAI LLM by env
 
-if __name__ == "__main__":
     # Get CrewAI LLM via active provider (e.g., LLM_PROVIDER=watsonx)
     try:
-        #llm = crew_llm()
         llm = model()  # -> CrewAI LLM with model="watsonx/<MODEL_ID>", creds from env
     except Exception as e:
         sys.stderr.write(f"[fatal] Could not initialize LLM: {e}\n")
         sys.exit(1)
 
-    city = os.getenv("CITY", "Genova, Italy")
+    # One city via CITY, or several via CITIES="Genova, Italy; Turin, Italy" (run concurrently).
+    cities = [c.strip() for c in os.getenv("CITIES", "").split(";") if c.strip()]
+    cities = cities or [os.getenv("CITY", "Genova, Italy")]
 
     # Tool (A2A backend)
     weather_tool = A2ATool(
@@ -36,28 +63,28 @@ if __name__ == "__main__":
     # Agents
     meteorologist = Agent(
         role="Meteorologist",
-        goal=f"Summarize actionable weather for {city}",
+        goal="Summarize actionable weather for {city}",
         backstory="A meticulous forecaster who turns raw data into practical guidance.",
         tools=[weather_tool],
         llm=llm,
-        verbose=True,
+        verbose=VERBOSE,
         allow_delegation=False,
     )
 
     planner = Agent(
         role="Itinerary Planner",
-        goal=f"Create an enjoyable one-day plan in {city} adapted to the weather.",
+        goal="Create an enjoyable one-day plan in {city} adapted to the weather.",
         backstory="A savvy local guide who balances walking, food, and culture.",
         tools=[],
         llm=llm,
-        verbose=True,
+        verbose=VERBOSE,
         allow_delegation=False,
     )
 
     # Tasks
     t_weather = Task(
         description=(
-            f"Use the weather tool to gather today's conditions for {city}. "
+            "Use the weather tool to gather today's conditions for {city}. "
             "Return a concise bullet list including: high/low temp (°C), rain likelihood, wind, "
             "UV level, and any alerts. End with 3 clothing/gear recommendations."
         ),
@@ -79,8 +106,21 @@ if __name__ == "__main__":
         expected_output="A Markdown day-plan with times, locations, and weather-aware alternatives.",
     )
 
-    crew = Crew(agents=[meteorologist, planner], tasks=[t_weather, t_plan], verbose=True)
-    result = crew.kickoff()
+    crew = Crew(agents=[meteorologist, planner], tasks=[t_weather, t_plan], verbose=VERBOSE)
+    # {city} placeholders are filled per kickoff; several cities fan out concurrently.
+    listener = _start_log_listener()
+    try:
+        if len(cities) == 1:
+            results = [await crew.kickoff_async(inputs={"city": cities[0]})]
+        else:
+            results = await crew.kickoff_for_each_async(inputs=[{"city": c} for c in cities])
+    finally:
+        listener.stop()
+
+    for city, result in zip(cities, results):
+        print(f"\n=== FINAL ITINERARY: {city} ===\n")
+        print(result)
 
-    print("\n=== FINAL ITINERARY ===\n")
-    print(result)
+
+if __name__ == "__main__":
+    asyncio.run(main())
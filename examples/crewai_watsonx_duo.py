@@ -1,49 +1,66 @@
 # File: examples/crewai_watsonx_duo.py
+import asyncio
+import functools
 import os
-from dotenv import load_dotenv
 
-from crewai import Agent, Task, Crew, LLM
-from a2a_universal.adapters.crewai_base_tool import A2AHelloTool
 
-# -------------------------------------------------------------------
-# Load environment variables
-# -------------------------------------------------------------------
-load_dotenv()
+def _load_env() -> None:
+    # Deferred imports: a misconfigured environment fails before crewai/litellm load.
+    from dotenv import load_dotenv
 
-# Required environment variables for Watsonx
-model_id = os.getenv("MODEL_ID", "ibm/granite-3-8b-instruct")  # ✅ updated default
-project_id = os.environ.get("WATSONX_PROJECT_ID")
-url = os.environ.get("WATSONX_URL")
-api_key = os.environ.get("WATSONX_API_KEY")
+    # -------------------------------------------------------------------
+    # Load environment variables
+    # -------------------------------------------------------------------
+    load_dotenv()
 
-if not all([project_id, url, api_key]):
-    raise RuntimeError(
-        "Missing Watsonx credentials. Please set WATSONX_PROJECT_ID, WATSONX_URL, and WATSONX_API_KEY in your .env file."
+    if not all(os.environ.get(k) for k in ("WATSONX_PROJECT_ID", "WATSONX_URL", "WATSONX_API_KEY")):
+        raise RuntimeError(
+            "Missing Watsonx credentials. Please set WATSONX_PROJECT_ID, WATSONX_URL, and WATSONX_API_KEY in your .env file."
+        )
+
+
+# Cached factories: repeated runs in one process (notebooks) reuse the same
+# LiteLLM-backed LLM and A2A tool instead of rebuilding their HTTP clients.
+@functools.cache
+def _watsonx_llm():
+    """Watsonx LLM (CrewAI-native via LiteLLM provider)."""
+    from crewai import LLM
+
+    # NOTE: CrewAI’s `LLM` expects a LiteLLM-compatible model string.
+    # For watsonx, you must prefix with "watsonx/"
+    model_id = os.getenv("MODEL_ID", "ibm/granite-3-8b-instruct")  # ✅ updated default
+    return LLM(
+        model=f"watsonx/{model_id}",
+        api_key=os.environ["WATSONX_API_KEY"],
+        base_url=os.environ["WATSONX_URL"],         # LiteLLM uses api_base/base_url for endpoint
+        temperature=0.0,
+        max_tokens=2048,
+        project_id=os.environ["WATSONX_PROJECT_ID"],  # forwarded to watsonx provider
     )
 
-# -------------------------------------------------------------------
-# Watsonx LLM (CrewAI-native via LiteLLM provider)
-# -------------------------------------------------------------------
-# NOTE: CrewAI’s `LLM` expects a LiteLLM-compatible model string.
-# For watsonx, you must prefix with "watsonx/"
-watsonx_llm = LLM(
-    model=f"watsonx/{model_id}",
-    api_key=api_key,
-    base_url=url,           # LiteLLM uses api_base/base_url for endpoint
-    temperature=0.0,
-    max_tokens=2048,
-    project_id=project_id,  # forwarded to watsonx provider
-)
-
-# -------------------------------------------------------------------
-# Main Crew workflow
-# -------------------------------------------------------------------
-if __name__ == "__main__":
-    topic = "Edge AI for autonomous drones in search & rescue"
 
-    # Shared A2A Tool
-    a2a_tool = A2AHelloTool()
-    a2a_tool.base_url = os.getenv("A2A_BASE", "http://localhost:8000")
+@functools.cache
+def _a2a_tool():
+    """Shared A2A tool used by both agents."""
+    from a2a_universal.adapters.crewai_base_tool import A2AHelloTool
+
+    tool = A2AHelloTool()
+    tool.base_url = os.getenv("A2A_BASE", "http://localhost:8000")
+    return tool
+
+
+async def main() -> None:
+    _load_env()
+
+    from crewai import Agent, Task, Crew
+
+    watsonx_llm = _watsonx_llm()
+    a2a_tool = _a2a_tool()
+
+    # -------------------------------------------------------------------
+    # Main Crew workflow
+    # -------------------------------------------------------------------
+    topic = "Edge AI for autonomous drones in search & rescue"
 
     # Researcher Agent
     researcher = Agent(
@@ -93,7 +110,11 @@ if __name__ == "__main__":
 
     # Crew assembly & execution
     crew = Crew(agents=[researcher, writer], tasks=[t_research, t_write])
-    result = crew.kickoff()
+    result = await crew.kickoff_async()
 
     print("\n=== FINAL LATEX ===\n")
     print(result)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
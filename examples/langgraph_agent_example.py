@@ -8,13 +8,19 @@ Client (this script) can use LangGraph freely.
 
 Env (optional):
   A2A_BASE_URL   : default http://localhost:8000
+
+Usage:
+  python examples/langgraph_agent_example.py ["question" ...]
+  # several questions are sent concurrently via app.abatch()
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-import json
-import httpx
+import sys
+
 from typing_extensions import Annotated, TypedDict
 
 from dotenv import load_dotenv
@@ -23,41 +29,54 @@ from langgraph.graph.message import add_messages, AnyMessage
 from langchain_core.messages import HumanMessage
 
 from a2a_universal.adapters.langgraph_agent import A2AAgentNode
+from a2a_universal.examples_common import readyz, run
 
 class GraphState(TypedDict):
     messages: Annotated[list[AnyMessage], add_messages]
 
 def _preflight_readyz(base: str) -> None:
     """Warn (don’t fail) if the server isn’t running with AGENT_FRAMEWORK=native."""
-    try:
-        r = httpx.get(f"{base.rstrip('/')}/readyz", timeout=5.0)
-        if r.status_code == 200:
-            data = r.json()
-            # best-effort sniffing; shape can vary by server version
-            text = json.dumps(data).lower()
-            if "crewai" in text and ("ready" in text or "framework" in text):
-                print("[WARN] A2A server looks configured for CrewAI. "
-                      "Run it with AGENT_FRAMEWORK=native for the LangGraph node.")
-        else:
-            print(f"[INFO] /readyz returned HTTP {r.status_code}; continuing.")
-    except Exception:
+    # Cached on disk for 30s and probed through the shared pooled client.
+    probe = readyz(base)
+    if probe is None:
         # Not fatal; keep going.
-        pass
-
-def main() -> None:
-    load_dotenv()
-    base_url = os.getenv("A2A_BASE_URL", "http://localhost:8000")
-    _preflight_readyz(base_url)
+        return
+    status, body = probe
+    if status == 200:
+        # best-effort sniffing; shape can vary by server version. A bytes scan
+        # is enough here, no need to decode and re-encode the JSON.
+        blob = body.lower()
+        if b"crewai" in blob and (b"ready" in blob or b"framework" in blob):
+            print("[WARN] A2A server looks configured for CrewAI. "
+                  "Run it with AGENT_FRAMEWORK=native for the LangGraph node.")
+    else:
+        print(f"[INFO] /readyz returned HTTP {status}; continuing.")
 
+@functools.cache
+def build_app(base_url: str):
+    """Compile the graph once per base URL; repeated runs in one process reuse it."""
     g = StateGraph(GraphState)
     g.add_node("a2a", A2AAgentNode(base_url=base_url))
     g.add_edge("__start__", "a2a")
     g.add_edge("a2a", END)
-    app = g.compile()
+    return g.compile()
+
+async def main(questions: list[str]) -> None:
+    # Python 3.12+: tasks whose result is already available finish eagerly,
+    # skipping one event-loop round-trip per fanned-out call.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    load_dotenv()
+    base_url = os.getenv("A2A_BASE_URL", "http://localhost:8000")
+    _preflight_readyz(base_url)
+
+    app = build_app(base_url)
 
-    out = app.invoke({"messages": [HumanMessage(content="What is the capital of Italy?")]})
-    # The node returns an AIMessage with the model's text
-    print(out["messages"][-1].content)
+    # Independent questions run concurrently instead of one round-trip after another.
+    outs = await app.abatch([{"messages": [HumanMessage(content=q)]} for q in questions])
+    for q, out in zip(questions, outs):
+        # The node returns an AIMessage with the model's text
+        print(f"{q}\n-> {out['messages'][-1].content}")
 
 if __name__ == "__main__":
-    main()
+    run(main(sys.argv[1:] or ["What is the capital of Italy?"]))
@@ -1,35 +1,9 @@
 # examples/quickstart_crewai_watsonx.py
-import httpx
 from crewai import Agent, Task, Crew
 from crewai_tools import Tool  # FIXED: Import the 'Tool' class, not the 'tool' decorator.
 
-BASE = "http://localhost:8000"
-
-# -------------------------------------------------------------------
-# Define the function as a standard Python function (no decorator)
-# -------------------------------------------------------------------
-def a2a_call(prompt: str) -> str:
-    """Send a user prompt to the Universal A2A agent and return its reply text."""
-    payload = {
-        "method": "message/send",
-        "params": {
-            "message": {
-                "role": "user",
-                "messageId": "crewai-tool",
-                "parts": [{"type": "text", "text": prompt}],
-            }
-        },
-    }
-    try:
-        r = httpx.post(f"{BASE}/a2a", json=payload, timeout=30.0)
-        r.raise_for_status()
-        data = r.json()
-        for p in (data.get("message") or {}).get("parts", []):
-            if p.get("type") == "text":
-                return p.get("text", "")
-        return "[No text part in A2A response]"
-    except Exception as e:
-        return f"[A2A call failed: {e}]"
+# Shared pooled client + pre-encoded request envelope (see a2a_universal/examples_common.py).
+from a2a_universal.examples_common import a2a_call_sync as a2a_call
 
 # -------------------------------------------------------------------
 # CrewAI setup
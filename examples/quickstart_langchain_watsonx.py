@@ -7,7 +7,7 @@ Example: LangChain Agent + Watsonx.ai + Universal A2A
 """
 
 import os
-import httpx
+
 from dotenv import load_dotenv
 
 from langchain.agents import initialize_agent, AgentType
@@ -15,44 +15,15 @@ from langchain.memory import ConversationBufferMemory
 from langchain_core.tools import Tool
 from langchain_ibm import ChatWatsonx
 
+# Shared pooled client + pre-encoded request envelope (see a2a_universal/examples_common.py).
+from a2a_universal.examples_common import a2a_call_sync as a2a_call
+
 
 # -------------------------------------------------------------------
 # Load environment variables
 # -------------------------------------------------------------------
 load_dotenv()
 
-BASE = os.getenv("A2A_BASE", "http://localhost:8000")
-
-
-# -------------------------------------------------------------------
-# Universal A2A tool wrapper
-# -------------------------------------------------------------------
-def a2a_call(prompt: str) -> str:
-    """Send a user message to the Universal A2A /a2a endpoint."""
-    payload = {
-        "method": "message/send",
-        "params": {
-            "message": {
-                "role": "user",
-                "messageId": "lc-tool",
-                "parts": [{"type": "text", "text": prompt}],
-            }
-        },
-    }
-
-    try:
-        r = httpx.post(f"{BASE}/a2a", json=payload, timeout=30.0)
-        r.raise_for_status()
-        data = r.json()
-        for p in (data.get("message") or {}).get("parts", []):
-            if p.get("type") == "text":
-                return p.get("text", "")
-        return "[No text part in A2A response]"
-    except httpx.HTTPError as e:
-        return f"[A2A HTTP Error: {e}]"
-    except Exception as e:
-        return f"[A2A call failed: {e}]"
-
 
 # -------------------------------------------------------------------
 # Main: Watsonx Orchestrator + LangChain Agent
@@ -1,36 +1,43 @@
 import asyncio
-import httpx
+import os
+import time
+from contextlib import asynccontextmanager
+
+# Optional aiohttp backend for high-concurrency benchmarks: A2A_HTTP_BACKEND=aiohttp
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None
+
 from langgraph.graph import StateGraph, MessagesState
 from langchain_core.messages import HumanMessage, AIMessage
 
-BASE = "http://localhost:8000"
+# Shared pooled AsyncClient + pre-encoded request envelope (see a2a_universal/examples_common.py).
+from a2a_universal.examples_common import (
+    JSON_HEADERS,
+    A2ACallError,
+    a2a_call_async,
+    base_url,
+    encode_message,
+    lifespan,
+    parse_reply,
+    run as run_loop,
+)
+
+USE_AIOHTTP = os.getenv("A2A_HTTP_BACKEND", "").strip().lower() == "aiohttp" and aiohttp is not None
+_SESSION = None  # shared aiohttp.ClientSession, opened in main() when USE_AIOHTTP
+
 
-# -------------------------------------------------------------------
-# A2A async call
-# -------------------------------------------------------------------
 async def a2a_send(text: str) -> str:
     """Send a message to Universal A2A and return its reply text."""
-    payload = {
-        "method": "message/send",
-        "params": {
-            "message": {
-                "role": "user",
-                "messageId": "lg-node",
-                "parts": [{"type": "text", "text": text}],
-            }
-        },
-    }
+    if _SESSION is None:
+        return await a2a_call_async(text)
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            r = await client.post(f"{BASE}/a2a", json=payload)
-            r.raise_for_status()
-            data = r.json()  # FIX: httpx .json() is synchronous
-            for p in (data.get("message") or {}).get("parts", []):
-                if p.get("type") == "text":
-                    return p.get("text", "")
-        return "[No text part in A2A response]"
-    except httpx.HTTPError as e:
-        return f"[A2A HTTP Error: {e}]"
+        async with _SESSION.post(f"{base_url()}/a2a", data=encode_message(text), headers=JSON_HEADERS) as resp:
+            resp.raise_for_status()
+            return parse_reply(await resp.read())
+    except A2ACallError as e:
+        return str(e)
     except Exception as e:
         return f"[A2A call failed: {e}]"
 
@@ -38,10 +45,17 @@ async def a2a_send(text: str) -> str:
 # LangGraph node: forward message to A2A
 # -------------------------------------------------------------------
 async def a2a_node(state: MessagesState) -> MessagesState:
-    last_message = state["messages"][-1]
-    user_text = getattr(last_message, "content", "")
-    reply_text = await a2a_send(user_text)
-    return {"messages": [AIMessage(content=reply_text)]}
+    # Every user turn since the last AI reply is independent, so send them
+    # concurrently over the shared client's pool (multiplexed on one HTTP/2
+    # connection when the server is https and h2 is installed).
+    pending = []
+    for message in reversed(state["messages"]):
+        if isinstance(message, AIMessage):
+            break
+        pending.append(message)
+    pending = pending[::-1] or state["messages"][-1:]
+    replies = await asyncio.gather(*(a2a_send(getattr(m, "content", "")) for m in pending))
+    return {"messages": [AIMessage(content=reply) for reply in replies]}
 
 # -------------------------------------------------------------------
 # Build LangGraph workflow
@@ -54,9 +68,63 @@ app = graph.compile()
 # -------------------------------------------------------------------
 # Run example
 # -------------------------------------------------------------------
+@asynccontextmanager
+async def http_backend():
+    """Open the HTTP backend for the run (aiohttp session or shared AsyncClient) and close it after."""
+    global _SESSION
+    # Python 3.12+: tasks whose result is already available finish eagerly,
+    # skipping one event-loop round-trip per fanned-out call.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    if USE_AIOHTTP:
+        # One tuned aiohttp session for the whole run (benchmark mode).
+        connector = aiohttp.TCPConnector(limit=200, limit_per_host=100, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30)) as _SESSION:
+            try:
+                yield
+            finally:
+                _SESSION = None
+    else:
+        # One long-lived AsyncClient for the whole run, closed before the loop exits.
+        async with lifespan():
+            yield
+
+
+async def run(text: str) -> str:
+    """Run the graph on one user message and return the final answer; reusable inside http_backend()."""
+    result = await app.ainvoke({"messages": [HumanMessage(content=text)]})
+    return result["messages"][-1].content
+
+
+async def warmup() -> None:
+    """
+    Send one throwaway request to open the pooled connection.
+
+    The first call pays DNS, TCP and (for https) the TLS handshake; calls after
+    it are keep-alive hits on the same connection.
+    """
+    await a2a_send("")
+
+
+async def bench(text: str, n: int) -> None:
+    """Warm the connection, then time *n* sequential runs on the same loop and client."""
+    async with http_backend():
+        await warmup()
+        timings = []
+        for _ in range(n):
+            t0 = time.perf_counter()
+            await run(text)
+            timings.append(time.perf_counter() - t0)
+    timings.sort()
+    print(f"[bench] n={n} min={timings[0]*1e3:.1f}ms median={timings[n // 2]*1e3:.1f}ms max={timings[-1]*1e3:.1f}ms")
+
+
 async def main():
-    result = await app.ainvoke({"messages": [HumanMessage(content="Tell me about Genova?")]})
-    print("\n[Final Answer]:", result["messages"][-1].content)
+    async with http_backend():
+        print("\n[Final Answer]:", await run("Tell me about Genova?"))
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # BENCH=N: warm up once, then time N runs (e.g. BENCH=100 python quickstart_langgraph_watsonx.py)
+    n = int(os.getenv("BENCH", "0"))
+    run_loop(bench("Tell me about Genova?", n) if n > 0 else main())
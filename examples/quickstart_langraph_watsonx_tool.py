@@ -8,55 +8,44 @@ Example: LangGraph Agent + Watsonx.ai + Universal A2A
   2. The orchestrator synthesizes those facts into a creative output.
 """
 
+import asyncio
 import os
-import httpx
+from typing import List
+
 from dotenv import load_dotenv
 
 from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.tools import Tool
+from langchain_core.tools import StructuredTool, Tool
 from langchain_ibm import ChatWatsonx
 
+# Shared keep-alive client + pre-encoded request envelope (see a2a_universal/examples_common.py):
+# each ReAct tool call reuses the pooled connection instead of opening a new one.
+from a2a_universal.examples_common import a2a_acall_many, a2a_call_sync as a2a_call, lifespan
+
 # -------------------------------------------------------------------
 # Load environment variables
 # -------------------------------------------------------------------
 load_dotenv()
 
-BASE = os.getenv("A2A_BASE", "http://localhost:8000")
 
 # -------------------------------------------------------------------
-# Universal A2A tool wrapper
+# Batch tool: independent questions fan out concurrently (wall time = slowest call)
 # -------------------------------------------------------------------
-def a2a_call(prompt: str) -> str:
-    """Send a user message to the Universal A2A /a2a endpoint."""
-    payload = {
-        "method": "message/send",
-        "params": {
-            "message": {
-                "role": "user",
-                "messageId": "lc-tool",
-                "parts": [{"type": "text", "text": prompt}],
-            }
-        },
-    }
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            r = client.post(f"{BASE}/a2a", json=payload)
-            r.raise_for_status()
-            data = r.json()
-            for p in (data.get("message") or {}).get("parts", []):
-                if p.get("type") == "text":
-                    return p.get("text", "")
-            return "[No text part in A2A response]"
-    except httpx.HTTPError as e:
-        return f"[A2A HTTP Error: {e}]"
-    except Exception as e:
-        return f"[A2A call failed: {e}]"
+def a2a_call_many(questions: List[str]) -> List[str]:
+    """Ask the A2A expert agent several independent questions; one reply per question."""
+    return [a2a_call(q) for q in questions]
+
+
+async def a2a_acall_many_tool(questions: List[str]) -> List[str]:
+    """Ask the A2A expert agent several independent questions; one reply per question."""
+    return await a2a_acall_many(questions)
+
 
 # -------------------------------------------------------------------
 # Main: Watsonx Orchestrator + LangGraph Agent
 # -------------------------------------------------------------------
-if __name__ == "__main__":
+async def main() -> None:
     # Required environment variables
     model_id = os.getenv("MODEL_ID", "ibm/granite-3-3-8b-instruct")
     project_id = os.environ.get("WATSONX_PROJECT_ID")
@@ -84,6 +73,12 @@ if __name__ == "__main__":
         description="Ask the A2A expert agent a question about a specific topic to get detailed facts. Use this to gather information before creating a summary or answering the final question.",
         func=a2a_call,
     )
+    expert_batch_tool = StructuredTool.from_function(
+        func=a2a_call_many,
+        coroutine=a2a_acall_many_tool,
+        name="a2a_expert_agent_batch",
+        description="Ask the A2A expert agent several independent questions at once (sent concurrently). Prefer this over repeated single calls when the questions do not depend on each other.",
+    )
 
     # Memory is handled by a checkpointer in LangGraph
     checkpointer = MemorySaver()
@@ -91,7 +86,7 @@ if __name__ == "__main__":
     # Build Agent using the modern LangGraph prebuilt helper
     agent_executor = create_react_agent(
         model=llm,
-        tools=[expert_tool],
+        tools=[expert_tool, expert_batch_tool],
         checkpointer=checkpointer
     )
 
@@ -103,12 +98,17 @@ if __name__ == "__main__":
 
     print(f"Executing workflow for query: '{query}'")
 
-    # Invoke the agent
-    response = agent_executor.invoke(
-        {"messages": [("human", query)]},
-        config=config,
-    )
-    
+    # Invoke the agent (async, so batch tool calls run concurrently on the shared client)
+    async with lifespan():
+        response = await agent_executor.ainvoke(
+            {"messages": [("human", query)]},
+            config=config,
+        )
+
     # The final answer is in the content of the last message in the state
     final_answer = response["messages"][-1].content
-    print("\n[Final Answer]:\n", final_answer)
\ No newline at end of file
+    print("\n[Final Answer]:\n", final_answer)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,16 +1,42 @@
+import argparse
 import os
+from functools import lru_cache
+
 from a2a_universal.providers import build_provider
 
-# Load environment variables from the .env file in the same directory as this script
+# Load environment variables from the .env file in the same directory as this script.
+# A few KEY=VALUE lines don't need python-dotenv; like load_dotenv, variables
+# already set in the environment win.
 from pathlib import Path
-from dotenv import load_dotenv
-load_dotenv(dotenv_path=Path(__file__).parent / '.env')
 
-def main():
+def _load_env(path: Path) -> None:
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return
+    for line in lines:
+        line = line.strip()
+        if "=" in line and not line.startswith("#"):
+            key, value = line.split("=", 1)
+            os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+
+_load_env(Path(__file__).parent / '.env')
+
+@lru_cache(maxsize=1)
+def _provider():
+    """Build the provider (SDK client, credentials, TLS context) once per process."""
     os.environ.setdefault("LLM_PROVIDER", "watsonx")
-    p = build_provider()
+    return build_provider()
+
+def main():
+    parser = argparse.ArgumentParser(description="Call the configured provider directly.")
+    parser.add_argument("--loop", type=int, default=1, metavar="N", help="repeat the generation N times")
+    args = parser.parse_args()
+
+    p = _provider()
     print("ready:", p.ready, "reason:", getattr(p, "reason", ""))
-    print("model reply:", p.generate(prompt="Tell me about Genova Italy"))
+    for _ in range(max(args.loop, 1)):
+        print("model reply:", p.generate(prompt="Tell me about Genova Italy"))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
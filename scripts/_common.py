@@ -0,0 +1,20 @@
+"""
+Helpers shared by the scripts in this directory.
+
+Stdlib only: setup_wizard.py runs before the package (or httpx) is installed.
+Scripts import it as a sibling module (``python scripts/<name>.py`` puts this
+directory on sys.path).
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+
+def backoff_delays(total: float = 5.0, first: float = 0.01, cap: float = 0.25) -> Iterator[float]:
+    """Yield sleep intervals 10ms, 20ms, 40ms … capped at *cap*, until about *total* seconds."""
+    delay, spent = first, 0.0
+    while spent < total:
+        yield delay
+        spent += delay
+        delay = min(delay * 2, cap)
@@ -5,9 +5,14 @@ Universal A2A Agent — Simple Integration Sanity Check
 Usage:
   python scripts/check_integrations.py
   BASE=http://localhost:9000 python scripts/check_integrations.py
+  python scripts/check_integrations.py --parallel [--workers N]
 
 What it does:
 - Ensures the A2A server is reachable (starts it if needed)
+    * --parallel starts uvicorn with N worker processes on a Unix socket instead,
+      so the concurrent checks are served by several workers (an already running
+      server is still reused). The BeeAI check is skipped on the socket: BeeAI
+      sends through its own HTTP client, which only speaks TCP
 - Runs minimal checks for each optional framework IF it's installed:
     * Base HTTP (/a2a) ping
     * LangChain tool adapter
@@ -15,46 +20,64 @@ What it does:
     * CrewAI BaseTool (no external LLM required)
     * AutoGen registered function
     * BeeAI Framework agent (async)
+- Runs all checks concurrently (sync adapters in worker threads), so the total
+  time is roughly that of the slowest check
 - Prints PASS/FAIL/SKIP lines + summary and exits 1 on any failure among attempted checks
 """
 
 from __future__ import annotations
+import argparse
+import asyncio
+import importlib.util
 import os
 import sys
+import tempfile
 import time
 import subprocess
 from typing import Tuple, List
 
+from _common import backoff_delays
+from a2a_universal.examples_common import JSON_HEADERS, encode_message
+from a2a_universal.http import set_client
+
 # --- Config ---
 BASE = os.getenv("BASE", "http://localhost:8000")
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "8000"))
+# Per-process socket: concurrent runs never share (or unlink) each other's socket.
+CHECK_SOCK = os.path.join(tempfile.gettempdir(), f"a2a-check-{os.getpid()}.sock")
 
 # --- Utilities ---
-def start_server_if_needed() -> subprocess.Popen | None:
-    """If /healthz is not responding, start uvicorn in the background and return the Popen handle."""
+def _is_up(client) -> bool:
+    """HEAD is enough: any HTTP answer means uvicorn is serving."""
     import httpx
     try:
-        httpx.get(f"{BASE}/healthz", timeout=1.0)
-        return None  # already up
-    except Exception:
-        pass
-
-    print(f"[-] Server not running at {BASE}, starting uvicorn …")
-    proc = subprocess.Popen([
-        sys.executable, "-m", "uvicorn",
-        "a2a_universal.server:app",
-        "--host", HOST, "--port", str(PORT)
-    ])
-    # Wait briefly for health
-    for _ in range(50):
-        try:
-            time.sleep(0.1)
-            httpx.get(f"{BASE}/healthz", timeout=0.5)
+        client.head("/healthz", timeout=0.5)
+        return True
+    except httpx.TransportError:
+        return False
+
+def _make_client(uds: str | None = None):
+    """Sync client for BASE; with *uds* the requests travel over that Unix socket."""
+    import httpx
+    transport = httpx.HTTPTransport(uds=uds) if uds else None
+    return httpx.Client(base_url=BASE, timeout=5.0, limits=httpx.Limits(max_keepalive_connections=4), transport=transport)
+
+def start_server(client, uds: str | None = None, workers: int = 1) -> subprocess.Popen:
+    """Start uvicorn in the background (on *uds* with *workers* processes if given) and wait for /healthz."""
+    if uds:
+        print(f"[-] Server not running at {BASE}, starting uvicorn on {uds} with {workers} workers …")
+        bind = ["--uds", uds, "--workers", str(workers)]
+    else:
+        print(f"[-] Server not running at {BASE}, starting uvicorn …")
+        bind = ["--host", HOST, "--port", str(PORT)]
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "a2a_universal.server:app", *bind])
+    # Wait briefly for health, backing off exponentially
+    for delay in backoff_delays():
+        time.sleep(delay)
+        if _is_up(client):
             print("[+] Server is up")
             return proc
-        except Exception:
-            continue
     print("[!] WARNING: healthz did not respond; tests may fail.")
     return proc
 
@@ -67,28 +90,18 @@ def stop_server(proc: subprocess.Popen | None) -> None:
     except Exception:
         proc.kill()
 
+def _installed(module: str) -> bool:
+    """Cheap presence probe: find the module spec without importing the framework."""
+    return importlib.util.find_spec(module) is not None
+
 def ok_text(text: str) -> bool:
     return isinstance(text, str) and "hello" in text.lower()
 
 # --- Individual checks (return tuple: (name, status_str, details)) ---
 
-def check_base_http() -> Tuple[str, str, str]:
-    import httpx
+async def check_base_http(client) -> Tuple[str, str, str]:
     try:
-        r = httpx.post(
-            f"{BASE}/a2a",
-            json={
-                "method": "message/send",
-                "params": {
-                    "message": {
-                        "role": "user",
-                        "messageId": "t1",
-                        "parts": [{"type": "text", "text": "ping"}],
-                    }
-                },
-            },
-            timeout=5.0,
-        )
+        r = await client.post("/a2a", content=encode_message("ping"), headers=JSON_HEADERS, timeout=5.0)
         r.raise_for_status()
         data = r.json()
         txt = data.get("message", {}).get("parts", [{}])[0].get("text", "")
@@ -97,8 +110,9 @@ def check_base_http() -> Tuple[str, str, str]:
         return ("base-http", "FAIL", repr(e))
 
 def check_langchain() -> Tuple[str, str, str]:
+    if not _installed("langchain"):
+        return ("langchain", "SKIP", "not installed")
     try:
-        import langchain  # noqa: F401
         from a2a_universal.adapters.langchain_tool import a2a_hello
     except Exception as e:
         return ("langchain", "SKIP", f"not installed or import failed: {e!r}")
@@ -115,6 +129,8 @@ def check_langchain() -> Tuple[str, str, str]:
         return ("langchain", "FAIL", repr(e))
 
 def check_langgraph() -> Tuple[str, str, str]:
+    if not _installed("langgraph"):
+        return ("langgraph", "SKIP", "not installed")
     try:
         from langgraph.graph import StateGraph, END, MessagesState
         from langchain_core.messages import HumanMessage
@@ -135,71 +151,95 @@ def check_langgraph() -> Tuple[str, str, str]:
 
 def check_crewai() -> Tuple[str, str, str]:
     # Use our BaseTool directly; no LLM keys required.
+    if not _installed("crewai"):
+        return ("crewai", "SKIP", "not installed")
     try:
-        import crewai  # noqa: F401
         from a2a_universal.adapters.crewai_base_tool import A2AHelloTool
     except Exception as e:
         return ("crewai", "SKIP", f"not installed or import failed: {e!r}")
     try:
         tool = A2AHelloTool()
+        tool.base_url = BASE
         txt = tool._run("ping from CrewAI")
         return ("crewai", "PASS" if ok_text(txt) else "FAIL", txt)
     except Exception as e:
         return ("crewai", "FAIL", repr(e))
 
 def check_autogen() -> Tuple[str, str, str]:
+    if not _installed("autogen"):
+        return ("autogen", "SKIP", "not installed")
     try:
-        import autogen  # noqa: F401
         from a2a_universal.adapters.autogen_tool import a2a_hello
     except Exception as e:
         return ("autogen", "SKIP", f"not installed or import failed: {e!r}")
     try:
-        txt = a2a_hello("ping from AutoGen")
+        txt = a2a_hello("ping from AutoGen", base_url=BASE)
         return ("autogen", "PASS" if ok_text(txt) else "FAIL", str(txt))
     except Exception as e:
         return ("autogen", "FAIL", repr(e))
 
-def check_beeai() -> Tuple[str, str, str]:
+async def check_beeai(uds: str | None = None) -> Tuple[str, str, str]:
+    if not _installed("beeai_framework"):
+        return ("beeai", "SKIP", "not installed")
+    if uds:
+        return ("beeai", "SKIP", f"server is on Unix socket {uds}; BeeAI's own HTTP client needs TCP (run without --parallel)")
     try:
-        import asyncio
         from beeai_framework.backend import UserMessage
         from a2a_universal.adapters.beeai_agent import make_beeai_agent
     except Exception as e:
         return ("beeai", "SKIP", f"not installed or import failed: {e!r}")
     try:
-        async def run_once():
-            agent = make_beeai_agent(BASE)
-            result = await agent.run(UserMessage("ping from BeeAI"))
-            return str(result)
-
-        txt = asyncio.run(run_once())
+        agent = make_beeai_agent(BASE)
+        txt = str(await agent.run(UserMessage("ping from BeeAI")))
         return ("beeai", "PASS" if ok_text(txt) else "FAIL", txt)
     except Exception as e:
         return ("beeai", "FAIL", repr(e))
 
 # --- Main driver ---
-def main() -> int:
+async def run_checks(uds: str | None = None) -> List[Tuple[str, str, str]]:
+    """Run every check concurrently; sync adapters run in worker threads. Results keep check order."""
+    import httpx
+    transport = httpx.AsyncHTTPTransport(uds=uds) if uds else None
+    async with httpx.AsyncClient(base_url=BASE, timeout=5.0, transport=transport) as client:
+        return list(await asyncio.gather(
+            check_base_http(client),
+            asyncio.to_thread(check_langchain),
+            asyncio.to_thread(check_langgraph),
+            asyncio.to_thread(check_crewai),
+            asyncio.to_thread(check_autogen),
+            check_beeai(uds),
+        ))
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sanity-check the A2A server and the installed framework adapters.")
+    parser.add_argument("--parallel", action="store_true",
+                        help=f"if no server is running, start one with several workers on {CHECK_SOCK}")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, metavar="N",
+                        help="uvicorn worker processes for --parallel (default: CPU count)")
+    args = parser.parse_args(argv)
+
     print(f"== Universal A2A Integration Check ==\nBASE={BASE}\n")
-    proc = start_server_if_needed()
-
-    checks = [
-        check_base_http,
-        check_langchain,
-        check_langgraph,
-        check_crewai,
-        check_autogen,
-        check_beeai,
-    ]
-    results: List[Tuple[str, str, str]] = []
+    # One sync client for the whole run: the health probe uses it directly and the
+    # adapter checks reach it through A2AClient's shared per-base registry.
+    client, uds, proc = _make_client(), None, None
+    if not _is_up(client):
+        if args.parallel:
+            # Same BASE for the adapters, but every request goes over the socket.
+            client.close()
+            uds = CHECK_SOCK
+            client = _make_client(uds)
+        proc = start_server(client, uds=uds, workers=max(args.workers, 1))
+    set_client(BASE, client)
+
     try:
-        for fn in checks:
-            name = fn.__name__.replace("check_", "")
-            print(f"-> {name} …", end=" ", flush=True)
-            res = fn()
-            results.append(res)
-            print(f"{res[1]}")
+        results = asyncio.run(run_checks(uds))
     finally:
+        client.close()
         stop_server(proc)
+        if uds and os.path.exists(uds):
+            os.unlink(uds)
+    for name, status, _ in results:
+        print(f"-> {name} … {status}")
 
     print("\nSummary:")
     attempted = 0
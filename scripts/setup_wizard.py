@@ -18,12 +18,16 @@ import argparse
 import os
 import platform
 import shutil
+import socket
 import subprocess
 import sys
+import tempfile
 import time
 from pathlib import Path
 from typing import List
 
+from _common import backoff_delays
+
 ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_VENV = ROOT / ".venv"
 
@@ -59,7 +63,11 @@ def ensure_venv(venv_dir: Path, py: str) -> None:
         print(f"Using existing virtualenv at {venv_dir}")
 
 
-def install_core_and_extras(pip: Path, extras: List[str]) -> None:
+# Skip pip's self-version check (a network round-trip per run) and never prompt.
+PIP_ENV = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_INPUT": "1"}
+
+
+def install_core_and_extras(pip: Path, extras: List[str], devtools: bool = False) -> None:
     # Build extras string like .[langgraph,crewai] or .[all]
     extras = [e for e in extras if e in EXTRAS]
     if "all" in extras:
@@ -69,14 +77,11 @@ def install_core_and_extras(pip: Path, extras: List[str]) -> None:
     else:
         extra_str = "."
 
-    print(f"Installing package in editable mode with extras: {extra_str}")
-    run([str(pip), "install", "--upgrade", "pip"])
-    run([str(pip), "install", "-e", extra_str])
-
-
-def install_dev_tools(pip: Path) -> None:
-    print("Installing dev tools …")
-    run([str(pip), "install", *DEV_TOOLS])
+    # Dev tools go into the same pip run, so the resolver runs once.
+    tools = DEV_TOOLS if devtools else []
+    print(f"Installing package in editable mode with extras: {extra_str}" + (" (+ dev tools)" if tools else ""))
+    run([str(pip), "install", "--upgrade", "pip"], env=PIP_ENV)
+    run([str(pip), "install", "--use-pep517", "-e", extra_str, *tools], env=PIP_ENV)
 
 
 def maybe_copy_env():
@@ -96,25 +101,59 @@ def maybe_copy_env():
         )
 
 
+def _wait_healthy_httpx(httpx, uds: str | None, port: int) -> bool:
+    """Poll /healthz with one client (over the Unix socket when given)."""
+    transport = httpx.HTTPTransport(uds=uds) if uds else None
+    with httpx.Client(transport=transport, base_url=f"http://localhost:{port}", timeout=0.5) as client:
+        for delay in backoff_delays(total=6.0):
+            try:
+                r = client.get("/healthz")
+                if r.status_code == 200:
+                    print(f"Health OK: {r.text}")
+                    return True
+            except httpx.TransportError:
+                pass
+            time.sleep(delay)
+    return False
+
+
+def _wait_healthy_urllib(port: int) -> bool:
+    """Fallback when the wizard's own interpreter has no httpx: one urllib opener over TCP."""
+    import urllib.request  # stdlib
+    health = f"http://localhost:{port}/healthz"
+    opener = urllib.request.build_opener()
+    for delay in backoff_delays(total=6.0):
+        try:
+            with opener.open(health, timeout=0.5) as resp:
+                if resp.status == 200:
+                    print(f"Health OK: {resp.read().decode('utf-8')}")
+                    return True
+        except Exception:
+            pass
+        time.sleep(delay)
+    return False
+
+
 def smoke_test(bin_dir: Path, host="0.0.0.0", port=8000) -> None:
     uvicorn = bin_dir / "uvicorn"
-    print("Starting server for a quick smoke test …")
-    proc = subprocess.Popen([str(uvicorn), "a2a_universal.server:app", "--host", host, "--port", str(port)])
     try:
-        import urllib.request  # stdlib
-        health = f"http://localhost:{port}/healthz"
+        import httpx
+    except ImportError:  # the wizard may run on a bare bootstrap interpreter
+        httpx = None
 
-        # wait briefly for server to come up
-        for _ in range(30):
-            try:
-                with urllib.request.urlopen(health, timeout=0.5) as resp:
-                    if resp.status == 200:
-                        body = resp.read().decode("utf-8")
-                        print(f"Health OK: {body}")
-                        break
-            except Exception:
-                time.sleep(0.2)
-        else:
+    # With httpx available (and not on Windows) bind uvicorn to a Unix socket:
+    # the health probes then skip loopback TCP entirely.
+    uds = None
+    if httpx is not None and hasattr(socket, "AF_UNIX") and not platform.system().lower().startswith("win"):
+        uds = os.path.join(tempfile.gettempdir(), f"a2a-smoke-{os.getpid()}.sock")
+    bind = ["--uds", uds] if uds else ["--host", host, "--port", str(port)]
+
+    print("Starting server for a quick smoke test …")
+    proc = subprocess.Popen([str(uvicorn), "a2a_universal.server:app", *bind])
+    try:
+        # wait briefly for server to come up (10ms, 20ms, 40ms … capped at 250ms)
+        healthy = _wait_healthy_httpx(httpx, uds, port) if httpx is not None else _wait_healthy_urllib(port)
+        if not healthy:
             print("WARNING: server health check did not succeed within timeout.")
 
     finally:
@@ -123,6 +162,8 @@ def smoke_test(bin_dir: Path, host="0.0.0.0", port=8000) -> None:
             proc.wait(timeout=3)
         except Exception:
             proc.kill()
+        if uds and os.path.exists(uds):
+            os.unlink(uds)
         print("Smoke test finished.")
 
 
@@ -190,9 +231,7 @@ def main():
     bin_dir = venv_bin(venv_dir)
     pip = bin_dir / "pip"
 
-    install_core_and_extras(pip, chosen_extras)
-    if args.devtools:
-        install_dev_tools(pip)
+    install_core_and_extras(pip, chosen_extras, devtools=args.devtools)
     if args.env:
         maybe_copy_env()
     if args.smoke:
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-import importlib.metadata
+from typing import TYPE_CHECKING, Any
 
-try:
-    # Dynamically pull version from installed package metadata
-    __version__ = importlib.metadata.version("universal-a2a-agent")
-except importlib.metadata.PackageNotFoundError:
-    # Fallback when running in dev mode (editable install)
-    __version__ = "0.0.0.dev0"
-
-from .client import A2AClient
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import A2AClient
 
 __all__ = ["A2AClient", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: resolve the version and the client on first access, so importing an
+    # adapter submodule doesn't pay for a metadata lookup or the client import.
+    value: Any
+    if name == "__version__":
+        import importlib.metadata
+
+        try:
+            # Dynamically pull version from installed package metadata
+            value = importlib.metadata.version("universal-a2a-agent")
+        except importlib.metadata.PackageNotFoundError:
+            # Fallback when running in dev mode (editable install)
+            value = "0.0.0.dev0"
+    elif name == "A2AClient":
+        from .client import A2AClient as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -0,0 +1,35 @@
+"""
+Per-request helpers kept free of heavy imports so `make compile-client` can build
+them with mypyc; the pure-Python module is used whenever no extension is present.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+# Loosely typed on purpose: compiled code type-checks arguments at the boundary,
+# and callers may hand in anything (None entries, non-list payloads).
+def extract_last_user_text(messages: Any) -> str:
+    """
+    Best-effort extraction of the latest user text from a universal message array.
+    Supports OpenAI-style {'role','content'} where content can be str or list parts.
+    """
+    if not isinstance(messages, list):
+        return ""
+    items: list = messages
+    for i in range(len(items) - 1, -1, -1):
+        m: Any = items[i]
+        if not m or m.get("role") != "user":
+            continue
+        content = m.get("content")
+        if isinstance(content, str):
+            if content.strip():
+                return content
+        elif isinstance(content, list):
+            for p in content:
+                if isinstance(p, dict) and p.get("type") == "text":
+                    txt = p.get("text", "")
+                    if isinstance(txt, str) and txt.strip():
+                        return txt
+    return ""
@@ -0,0 +1,50 @@
+"""
+JSON encode/decode for the A2A wire format.
+
+orjson encodes/decodes several times faster than stdlib json and works on bytes
+directly; it is an optional speedup (pip install -e .[speedups]). Both
+implementations produce the same compact UTF-8 bytes, so callers never need to
+know which one is active.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Tuple
+
+__all__ = ["dumps", "loads", "split_around"]
+
+dumps: Callable[[Any], bytes]
+loads: Callable[[Any], Any]
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:  # optional speedup (pip install -e .[speedups])
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    dumps = _json_dumps
+    loads = json.loads
+
+
+def split_around(encode: Callable[[str], bytes]) -> Tuple[bytes, bytes]:
+    """
+    Encode a payload once and split it where one string value goes.
+
+    *encode(value)* must return the JSON bytes of the payload with *value* in
+    the slot to fill. The result ``(head, tail)`` satisfies
+    ``head + dumps(text) + tail == encode(text)``. A placeholder is put in the
+    slot and lengthened until it occurs exactly once, so fixed values elsewhere
+    in the payload (ids, tool names, skills) can't be mistaken for the slot.
+    """
+    marker = "__a2a_text__"
+    while True:
+        pieces = encode(marker).split(dumps(marker))
+        if len(pieces) == 2:
+            return pieces[0], pieces[1]
+        if len(pieces) < 2:
+            raise ValueError("encode() did not place its argument in the payload")
+        marker += "_"
@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Pieces shared by the adapters that need no framework import.
+
+The LangGraph nodes (messages-state A2AAgentNode and dict-state A2ANode) take
+their env defaults and send-with-retries loop from here, so the plain A2ANode
+works with nothing but httpx installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import re
+import time
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+import httpx
+
+from ..client import A2AClient
+
+# --- Env helpers -----------------------------------------------------------------
+
+_TRUE_VALUES: frozenset[str] = frozenset({"1", "true", "yes", "y"})
+
+
+def bool_env(name: str, default: bool = False, _true: frozenset[str] = _TRUE_VALUES) -> bool:
+    v = os.getenv(name)
+    if v is None:
+        return default
+    return v.strip().lower() in _true
+
+
+def int_env(name: str, default: int) -> int:
+    v = os.getenv(name)
+    if v is None:
+        return default
+    try:
+        return int(v)
+    except Exception:
+        return default
+
+
+def float_env(name: str, default: float) -> float:
+    v = os.getenv(name)
+    if v is None:
+        return default
+    try:
+        return float(v)
+    except Exception:
+        return default
+
+
+class NodeDefaults(NamedTuple):
+    base_url: str
+    use_jsonrpc: bool
+    timeout_sec: float
+    retries: int
+    offline_fallback: bool
+    retry_cap_ms: int
+
+
+@lru_cache(maxsize=1)
+def node_defaults() -> NodeDefaults:
+    """LangGraph node defaults from the environment, read once; ``node_defaults.cache_clear()`` re-reads them."""
+    return NodeDefaults(
+        base_url=os.getenv("A2A_BASE_URL", "http://localhost:8000").rstrip("/"),
+        use_jsonrpc=bool_env("A2A_USE_JSONRPC", False),
+        timeout_sec=float_env("A2A_NODE_TIMEOUT_SEC", 30.0),
+        retries=int_env("A2A_NODE_RETRIES", 2),
+        offline_fallback=bool_env("A2A_OFFLINE_FALLBACK", False),
+        retry_cap_ms=int_env("A2A_RETRY_CAP_MS", 5000),
+    )
+
+
+# --- Preflight -------------------------------------------------------------------
+
+# /readyz bodies only need to mention CrewAI: search the raw bytes, no decode or lowercasing.
+CREWAI_RE = re.compile(rb"crewai", re.IGNORECASE)
+
+
+# --- Retries ---------------------------------------------------------------------
+
+def is_retryable(e: BaseException) -> bool:
+    """Transport errors (connect, timeouts, dropped connections) and 5xx replies are retried; other errors are final."""
+    if isinstance(e, httpx.TransportError):
+        return True
+    return isinstance(e, httpx.HTTPStatusError) and e.response.status_code >= 500
+
+
+def backoff(attempt: int, cap_ms: int, base_ms: int = 100) -> float:
+    """Seconds to wait before retry *attempt*: full jitter over a capped exponential."""
+    return random.uniform(0, min(cap_ms, base_ms * (2 ** attempt))) / 1000.0
+
+
+class Outcome(NamedTuple):
+    """Result of a send with retries: the reply, or the last error and how many attempts were made."""
+    reply: Any
+    t0: Optional[float]
+    error: Optional[Exception]
+    attempts: int
+
+
+def _log_attempt(log: logging.Logger, use_jsonrpc: bool, attempt: int, retries: int) -> None:
+    log.debug(
+        "A2A request start: route=%s attempt=%d/%d",
+        "JSON-RPC" if use_jsonrpc else "A2A",
+        attempt + 1,
+        retries + 1,
+    )
+
+
+def _log_failure(log: logging.Logger, e: Exception, attempt: int, retries: int) -> None:
+    kind = "HTTP error" if isinstance(e, httpx.HTTPError) else "call failed"
+    log.warning("A2A %s (%s) on attempt %d/%d", kind, e.__class__.__name__, attempt + 1, retries + 1)
+
+
+def send_with_retries(
+    client: A2AClient,
+    text: str,
+    *,
+    use_jsonrpc: bool,
+    retries: int,
+    retry_cap_ms: int,
+    log: logging.Logger,
+    debug: bool = False,
+) -> Outcome:
+    """
+    Send *text* with up to *retries* retries of transient failures.
+
+    Never raises for a failed send: the outcome carries the last error. With
+    *debug* set, attempts are logged and ``t0`` is the start of the successful one.
+    """
+    last_exc: Optional[Exception] = None
+    attempt = 0
+    for attempt in range(retries + 1):
+        try:
+            if debug:
+                _log_attempt(log, use_jsonrpc, attempt, retries)
+            t0 = time.perf_counter() if debug else None
+            return Outcome(client.send(text, use_jsonrpc=use_jsonrpc), t0, None, attempt + 1)
+        except Exception as e:  # noqa: BLE001
+            last_exc = e
+            _log_failure(log, e, attempt, retries)
+            if not is_retryable(e):
+                break
+
+        if attempt < retries:
+            time.sleep(backoff(attempt, retry_cap_ms))
+
+    return Outcome(None, None, last_exc, attempt + 1)
+
+
+async def asend_with_retries(
+    client: A2AClient,
+    text: str,
+    *,
+    use_jsonrpc: bool,
+    retries: int,
+    retry_cap_ms: int,
+    log: logging.Logger,
+    debug: bool = False,
+) -> Outcome:
+    """Async twin of :func:`send_with_retries`, on ``A2AClient.asend``."""
+    last_exc: Optional[Exception] = None
+    attempt = 0
+    for attempt in range(retries + 1):
+        try:
+            if debug:
+                _log_attempt(log, use_jsonrpc, attempt, retries)
+            t0 = time.perf_counter() if debug else None
+            reply = await client.asend(text, use_jsonrpc=use_jsonrpc)
+            return Outcome(reply, t0, None, attempt + 1)
+        except Exception as e:  # noqa: BLE001
+            last_exc = e
+            _log_failure(log, e, attempt, retries)
+            if not is_retryable(e):
+                break
+
+        if attempt < retries:
+            await asyncio.sleep(backoff(attempt, retry_cap_ms))
+
+    return Outcome(None, None, last_exc, attempt + 1)
@@ -7,8 +7,8 @@ except Exception:
             return f
         return deco
 
-from ..client import A2AClient
+from ..client import shared_client
 
 @register_function("a2a_hello", description="Send text to A2A agent and return reply")
 def a2a_hello(text: str, base_url: str = "http://localhost:8000", use_jsonrpc: bool = False) -> str:
-    return A2AClient(base_url).send(text, use_jsonrpc=use_jsonrpc)
+    return shared_client(base_url).send(text, use_jsonrpc=use_jsonrpc)
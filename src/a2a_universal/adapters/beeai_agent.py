@@ -5,7 +5,7 @@ BeeAI framework adapter for the Universal A2A Agent.
 Goals (prod-ready):
 - Minimal, robust factory to create a BeeAI Agent bound to the A2A agent card.
 - Safe defaults from environment, easy to override via parameters.
-- One-time /readyz preflight with clear warnings if the server is not in `native` framework.
+- One-time (per server) /readyz preflight with clear warnings if the server is not in `native` framework.
 - Version-tolerant construction for BeeAI's A2AAgent (handles multiple constructor/classmethod shapes).
 - Post-construction fixups when the agent_card is a dict (wrap as attribute-style object), and
   normalize camelCase -> snake_case keys (e.g., preferredTransport -> preferred_transport).
@@ -17,7 +17,7 @@ Server requirement:
 ENV (optional):
 - A2A_BASE_URL        : Base URL for the A2A server (default: http://localhost:8000)
 - BEEAI_AGENT_DEBUG   : "true" to enable DEBUG logs in this module (default: false)
-- BEEAI_PREFLIGHT     : "true" to run a one-time /readyz preflight (default: true)
+- BEEAI_PREFLIGHT     : "true" to run a one-time /readyz preflight per server (default: true)
 
 Usage:
     from a2a_universal.adapters.beeai_agent import make_beeai_agent
@@ -27,16 +27,19 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import logging
 import os
-import re
+import time
+from functools import lru_cache
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from types import SimpleNamespace
 
 import httpx
 
+from ..http import get_client
+from ._common import CREWAI_RE, bool_env
+
 try:
     from beeai_framework.adapters.a2a.agents.agent import A2AAgent as BeeA2AAgent  # type: ignore
     from beeai_framework.memory import UnconstrainedMemory  # type: ignore
@@ -47,14 +50,14 @@ except Exception as _e:  # pragma: no cover
 else:
     _IMPORT_ERROR = None
 
-__all__ = ["make_beeai_agent", "preflight_readyz"]
+__all__ = ["make_beeai_agent", "preflight_readyz", "clear_card_cache"]
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
 
 _LOG = logging.getLogger(__name__)
-if os.getenv("BEEAI_AGENT_DEBUG", "").strip().lower() in {"1", "true", "yes", "y"}:
+if bool_env("BEEAI_AGENT_DEBUG"):
     _LOG.setLevel(logging.DEBUG)
 
 
@@ -62,98 +65,180 @@ if os.getenv("BEEAI_AGENT_DEBUG", "").strip().lower() in {"1", "true", "yes", "y
 # Env helpers
 # ---------------------------------------------------------------------------
 
-def _bool_env(name: str, default: bool = False) -> bool:
-    v = os.getenv(name)
-    if v is None:
-        return default
-    return v.strip().lower() in {"1", "true", "yes", "y"}
-
-
 def _base_url(default: str = "http://localhost:8000") -> str:
     return os.getenv("A2A_BASE_URL", default).rstrip("/")
 
 
 # ---------------------------------------------------------------------------
-# One-time /readyz preflight (warn if server uses CrewAI framework)
+# One-time /readyz preflight per server (warn if it uses the CrewAI framework)
 # ---------------------------------------------------------------------------
 
-_PREFLIGHT_DONE = False
+# Base URLs already checked: each server is probed once per process.
+_PREFLIGHT_DONE: set[str] = set()
 _PREFLIGHT_LOCK = Lock()
 
 
 def preflight_readyz(base_url: str, *, context: str = "BeeAI agent") -> None:
-    """Best-effort preflight to detect server framework mismatch."""
-    global _PREFLIGHT_DONE
-    if _PREFLIGHT_DONE:
+    """Best-effort preflight to detect server framework mismatch (once per base URL)."""
+    base_url = base_url.rstrip("/")
+    if base_url in _PREFLIGHT_DONE:  # fast path, no lock
         return
     with _PREFLIGHT_LOCK:
-        if _PREFLIGHT_DONE:
-            return
-        if not _bool_env("BEEAI_PREFLIGHT", True):
-            _PREFLIGHT_DONE = True
+        if base_url in _PREFLIGHT_DONE:
             return
         try:
-            r = httpx.get(f"{base_url}/readyz", timeout=5.0)
-            if r.status_code == 200:
-                data = r.json()
-                text = json.dumps(data).lower()
-                if "crewai" in text:
-                    _LOG.warning(
-                        "[WARN] A2A server looks configured for CrewAI. "
-                        "Run it with AGENT_FRAMEWORK=native for the %s.",
-                        context,
-                    )
-            else:
-                _LOG.debug("Preflight /readyz returned HTTP %s; continuing.", r.status_code)
+            if bool_env("BEEAI_PREFLIGHT", True):
+                r = get_client(base_url).get(f"{base_url}/readyz", timeout=5.0)
+                if r.status_code == 200:
+                    if CREWAI_RE.search(r.content):
+                        _LOG.warning(
+                            "[WARN] A2A server looks configured for CrewAI. "
+                            "Run it with AGENT_FRAMEWORK=native for the %s.",
+                            context,
+                        )
+                else:
+                    _LOG.debug("Preflight /readyz returned HTTP %s; continuing.", r.status_code)
         except Exception as e:  # noqa: BLE001
             _LOG.debug("Preflight /readyz skipped due to error: %r", e)
         finally:
-            _PREFLIGHT_DONE = True
+            _PREFLIGHT_DONE.add(base_url)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
-
-
+@lru_cache(maxsize=4096)
 def _to_snake(s: str) -> str:
-    """Convert camelCase/PascalCase/kebab-case to snake_case."""
-    if "-" in s or " " in s:
-        s = s.replace("-", "_").replace(" ", "_")
-    s = _CAMEL_SPLIT_RE.sub("_", s).lower()
-    s = re.sub(r"__+", "_", s)
-    return s
+    """Convert camelCase/PascalCase/kebab-case to snake_case (memoized: card keys repeat)."""
+    # Most card keys (name, url, skills, ...) are already snake_case.
+    if s.isidentifier() and s.islower() and "__" not in s:
+        return s
+    # Single pass: underscore before each inner ASCII capital, "-"/" " become "_",
+    # and runs of underscores collapse to one as they are emitted. Other
+    # letters mark no word boundary; everything is lowercased at the end.
+    out: list[str] = []
+    prev_us = False
+    for i, c in enumerate(s):
+        if c in "_- ":
+            if not prev_us:
+                out.append("_")
+                prev_us = True
+        else:
+            if "A" <= c <= "Z" and i and not prev_us:
+                out.append("_")
+            out.append(c)
+            prev_us = False
+    return "".join(out).lower()
+
+
+def _needs_alias(obj: Any) -> bool:
+    """True if any dict key anywhere in *obj* has a different snake_case form; stops at the first one."""
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if _to_snake(k) != k:
+                    return True
+                if isinstance(v, (dict, list)):
+                    stack.append(v)
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+    return False
 
 
 def _alias_keys(obj: Any) -> Any:
     """
     Recursively add snake_case aliases for dict keys that are camelCase/PascalCase/kebab-case.
     Keeps the original keys as well. For lists, processes each element.
+    A tree with nothing to alias is returned as is, not copied.
+
+    Walks the tree with an explicit stack: each nested dict/list gets its (empty)
+    output container up front and is filled when popped, so no Python frame is
+    spent per node.
     """
-    if isinstance(obj, list):
-        return [_alias_keys(x) for x in obj]
-    if not isinstance(obj, dict):
-        return obj
-
-    out: dict[str, Any] = {}
-    for k, v in obj.items():
-        out[k] = _alias_keys(v)
-        snake = _to_snake(k)
-        if snake != k and snake not in out:
-            out[snake] = _alias_keys(v)
-    return out
+    if not _needs_alias(obj):
+        return obj  # already snake_case throughout (or not a container): nothing to add
+
+    root: Any = {} if isinstance(obj, dict) else [None] * len(obj)
+    stack: list[tuple[Any, Any]] = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
+        for k, v in items:
+            if isinstance(v, dict):
+                value: Any = {}
+                stack.append((v, value))
+            elif isinstance(v, list):
+                value = [None] * len(v)
+                stack.append((v, value))
+            else:
+                value = v
+            # The original key and its alias share the converted value.
+            dst[k] = value
+            if isinstance(src, dict):
+                snake = _to_snake(k)
+                if snake != k and snake not in dst:
+                    dst[snake] = value
+    return root
+
+
+def _origin(url: str) -> str:
+    """scheme://host[:port] of *url*: the key of the shared pool the card fetch uses."""
+    u = httpx.URL(url)
+    return f"{u.scheme}://{u.netloc.decode('ascii')}"
+
+
+# card_url -> (etag, fresh until [time.monotonic()], aliased card). Treat cached cards as read-only.
+_CARD_CACHE: dict[str, tuple[Optional[str], float, dict[str, Any]]] = {}
+# Freshness for cards served without a Cache-Control max-age.
+_CARD_TTL_SEC = 60.0
+
+
+def _max_age(resp: httpx.Response) -> float:
+    """Seconds *resp* may be reused: Cache-Control max-age, 0 for no-cache/no-store, else _CARD_TTL_SEC."""
+    for directive in resp.headers.get("cache-control", "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-cache", "no-store"):
+            return 0.0
+        if name == "max-age":
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                return 0.0
+    return _CARD_TTL_SEC
+
+
+def clear_card_cache() -> None:
+    """Forget every cached agent card (e.g. after redeploying the server, or in tests)."""
+    _CARD_CACHE.clear()
 
 
 def _fetch_agent_card(card_url: str) -> Optional[dict[str, Any]]:
-    """Fetch and return the agent-card JSON, or None on failure."""
+    """
+    Fetch and return the aliased agent-card JSON, or None on failure.
+
+    Cards are cached per URL for the server's Cache-Control max-age (default
+    _CARD_TTL_SEC). Once stale, a card with an ETag is revalidated with
+    If-None-Match (a 304 keeps it for another max-age); one without is fetched again.
+    """
+    cached = _CARD_CACHE.get(card_url)
+    now = time.monotonic()
+    if cached is not None and now < cached[1]:
+        return cached[2]
+    headers = {"If-None-Match": cached[0]} if cached is not None and cached[0] else None
     try:
-        resp = httpx.get(card_url, timeout=10.0)
+        resp = get_client(_origin(card_url)).get(card_url, headers=headers, timeout=10.0)
+        if resp.status_code == 304 and cached is not None:
+            _CARD_CACHE[card_url] = (resp.headers.get("etag", cached[0]), now + _max_age(resp), cached[2])
+            return cached[2]
         resp.raise_for_status()
         data = resp.json()
         if isinstance(data, dict):
-            return _alias_keys(data)
+            card = _alias_keys(data)
+            _CARD_CACHE[card_url] = (resp.headers.get("etag"), now + _max_age(resp), card)
+            return card
     except Exception as e:  # noqa: BLE001
         _LOG.warning("Failed to fetch agent card from %s: %r", card_url, e)
     return None
@@ -165,34 +250,42 @@ def _ensure_attr_aliases_ns(ns: SimpleNamespace) -> SimpleNamespace:
     add snake_case attribute aliases (non-destructively).
     """
     for k, v in vars(ns).copy().items():
+        # One pass: alias nested dicts/lists once and share the result with the alias.
+        value = _alias_keys(v) if isinstance(v, (dict, list)) else v
+        if value is not v:
+            setattr(ns, k, value)
         snake = _to_snake(k)
         if snake != k and not hasattr(ns, snake):
-            setattr(ns, snake, v)
-        # Recurse into nested dicts/namespaces/lists
-        if isinstance(v, dict):
-            v_alias = _alias_keys(v)
-            setattr(ns, snake if snake != k else k, v_alias)
-        elif isinstance(v, list):
-            new_list = []
-            for item in v:
-                if isinstance(item, dict):
-                    new_list.append(_alias_keys(item))
-                else:
-                    new_list.append(item)
-            setattr(ns, k, new_list)
+            setattr(ns, snake, value)
     return ns
 
 
-def _wrap_card_obj(card_obj: Any) -> SimpleNamespace:
+class _AttrDict(dict):
+    """Dict with attribute access (``card.preferred_transport``); missing keys raise AttributeError."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    __setattr__ = dict.__setitem__
+
+
+def _wrap_card_obj(card_obj: Any, *, aliased: bool = False) -> Any:
     """
-    Convert a card object (possibly dict or SimpleNamespace) into a SimpleNamespace
-    with snake_case aliases added for camelCase keys.
+    Give a card object (possibly dict or SimpleNamespace) attribute access, with
+    snake_case aliases added for camelCase keys. Dicts become an :class:`_AttrDict`.
+
+    Pass ``aliased=True`` for dicts that already went through :func:`_alias_keys`
+    (e.g. from :func:`_fetch_agent_card`) to skip a second traversal.
     """
     if isinstance(card_obj, SimpleNamespace):
         return _ensure_attr_aliases_ns(card_obj)
     if isinstance(card_obj, dict):
-        card_obj = _alias_keys(card_obj)
-        return SimpleNamespace(**card_obj)
+        return _AttrDict(card_obj if aliased else _alias_keys(card_obj))
     return SimpleNamespace(value=card_obj)
 
 
@@ -202,7 +295,7 @@ def _post_construct_fixups(agent: Any, card_url: str) -> Any:
 
     - Ensure both `agent_card` (public) and `_agent_card` (private) exist
       and point to the same object.
-    - If the card is a dict, wrap it with SimpleNamespace for attribute access and
+    - If the card is a dict, wrap it as an attribute-access dict and
       add snake_case aliases (e.g., preferredTransport -> preferred_transport).
     - Ensure `_url` is set to the card URL when missing.
     """
@@ -214,14 +307,15 @@ def _post_construct_fixups(agent: Any, card_url: str) -> Any:
         elif hasattr(agent, "agent_card"):
             card_obj = getattr(agent, "agent_card")
 
-        # 2) If missing entirely, fetch the card from the URL
+        # 2) If missing entirely, fetch the card from the URL (already aliased)
+        fetched = False
         if card_obj is None:
             card_dict = _fetch_agent_card(card_url)
             if card_dict:
-                card_obj = card_dict
+                card_obj, fetched = card_dict, True
 
-        # 3) Wrap into SimpleNamespace + add aliases
-        card_ns = _wrap_card_obj(card_obj) if card_obj is not None else None
+        # 3) Wrap for attribute access + add aliases
+        card_ns = _wrap_card_obj(card_obj, aliased=fetched) if card_obj is not None else None
 
         # 4) Ensure BOTH attributes exist and point to the same object
         if card_ns is not None:
@@ -244,6 +338,19 @@ def _post_construct_fixups(agent: Any, card_url: str) -> Any:
     return agent
 
 
+# The construction path that worked for the installed BeeAI version, as
+# build(card_url, memory) -> agent; later constructions skip the probing ladder.
+_SUCCESSFUL_CTOR: Optional[Callable[..., Any]] = None
+
+
+def _require_card(card_url: str) -> dict[str, Any]:
+    """Like _fetch_agent_card, but raise instead of returning None."""
+    card = _fetch_agent_card(card_url)
+    if card is None:
+        raise RuntimeError(f"agent card unavailable at {card_url}")
+    return card
+
+
 def _construct_bee_agent(card_url: str) -> Any:
     """
     Try multiple construction paths to be compatible with various BeeAI versions.
@@ -252,7 +359,12 @@ def _construct_bee_agent(card_url: str) -> Any:
     1) Classmethods: from_agent_card_url / from_url / from_card / from_card_url
     2) Constructor kwargs: agent_card_url / card_url / url / agent_url / a2a_url
     3) Constructor with preloaded card: agent_card=card
+
+    The first path that succeeds is remembered and tried first next time.
+    Card-based paths fetch the card when replayed and fail (falling back to the
+    ladder) if it can't be fetched.
     """
+    global _SUCCESSFUL_CTOR
     if BeeA2AAgent is None:  # type: ignore[truthy-function]
         raise RuntimeError(
             f"beeai_framework is not installed correctly: {_IMPORT_ERROR!r}"
@@ -260,68 +372,78 @@ def _construct_bee_agent(card_url: str) -> Any:
 
     memory = UnconstrainedMemory()  # type: ignore[call-arg]
 
+    if _SUCCESSFUL_CTOR is not None:
+        try:
+            return _post_construct_fixups(_SUCCESSFUL_CTOR(card_url, memory), card_url)
+        except Exception as e:
+            _LOG.debug("Cached BeeAI constructor failed, probing again: %r", e)
+            _SUCCESSFUL_CTOR = None
+
+    def attempt(build: Callable[..., Any], **kw: Any) -> Any:
+        # *kw* (the card already fetched by the ladder) is only used for this
+        # call; the remembered *build* gets just (url, memory).
+        global _SUCCESSFUL_CTOR
+        agent = build(card_url, memory, **kw)
+        _SUCCESSFUL_CTOR = build
+        return _post_construct_fixups(agent, card_url)
+
+    # Fetched at most once per call, by the first card-based path that needs it.
+    fetched: list[Optional[dict[str, Any]]] = []
+
+    def ladder_card() -> Optional[dict[str, Any]]:
+        if not fetched:
+            fetched.append(_fetch_agent_card(card_url))
+        return fetched[0]
+
     # --- 1) Classmethod variants -------------------------------------------------
     for meth_name in ("from_agent_card_url", "from_url", "from_card_url"):
         ctor = getattr(BeeA2AAgent, meth_name, None)
         if callable(ctor):
             try:
                 try:
-                    agent = ctor(card_url, memory=memory)  # type: ignore[call-arg]
+                    return attempt(lambda url, mem, c=ctor: c(url, memory=mem))  # type: ignore[call-arg]
                 except TypeError:
-                    agent = ctor(card_url)  # type: ignore[call-arg]
-                return _post_construct_fixups(agent, card_url)
+                    return attempt(lambda url, mem, c=ctor: c(url))  # type: ignore[call-arg]
             except Exception as e:
                 _LOG.debug("BeeAI A2AAgent.%s failed: %r", meth_name, e)
 
     # Some versions may expose .from_card expecting the JSON dict.
     ctor = getattr(BeeA2AAgent, "from_card", None)
     if callable(ctor):
-        card = _fetch_agent_card(card_url)
+        card = ladder_card()
         if card:
             try:
                 try:
-                    agent = ctor(card, memory=memory)  # type: ignore[call-arg]
+                    return attempt(lambda url, mem, card=None, c=ctor: c(card or _require_card(url), memory=mem), card=card)  # type: ignore[call-arg]
                 except TypeError:
-                    agent = ctor(card)  # type: ignore[call-arg]
-                return _post_construct_fixups(agent, card_url)
+                    return attempt(lambda url, mem, card=None, c=ctor: c(card or _require_card(url)), card=card)  # type: ignore[call-arg]
             except Exception as e:
                 _LOG.debug("BeeAI A2AAgent.from_card failed: %r", e)
 
     # --- 2) Constructor kwargs (URL-style) --------------------------------------
-    for kwargs in (
-        {"agent_card_url": card_url, "memory": memory},
-        {"card_url": card_url, "memory": memory},
-        {"url": card_url, "memory": memory},
-        {"agent_url": card_url, "memory": memory},
-        {"a2a_url": card_url, "memory": memory},
-        {"agent_card_url": card_url},
-        {"card_url": card_url},
-        {"url": card_url},
-        {"agent_url": card_url},
-        {"a2a_url": card_url},
-    ):
-        try:
-            agent = BeeA2AAgent(**kwargs)  # type: ignore[call-arg]
-            return _post_construct_fixups(agent, card_url)
-        except TypeError as e:
-            _LOG.debug("BeeAI A2AAgent(**%r) signature mismatch: %r", kwargs, e)
-        except Exception as e:
-            _LOG.debug("BeeAI A2AAgent(**%r) failed: %r", kwargs, e)
+    for with_memory in (True, False):
+        for key in ("agent_card_url", "card_url", "url", "agent_url", "a2a_url"):
+            try:
+                if with_memory:
+                    return attempt(lambda url, mem, k=key: BeeA2AAgent(**{k: url, "memory": mem}))  # type: ignore[call-arg]
+                return attempt(lambda url, mem, k=key: BeeA2AAgent(**{k: url}))  # type: ignore[call-arg]
+            except TypeError as e:
+                _LOG.debug("BeeAI A2AAgent(%s=..., memory=%s) signature mismatch: %r", key, with_memory, e)
+            except Exception as e:
+                _LOG.debug("BeeAI A2AAgent(%s=..., memory=%s) failed: %r", key, with_memory, e)
 
     # --- 3) Constructor with preloaded card dict --------------------------------
-    card = _fetch_agent_card(card_url)
+    card = ladder_card()
     if card:
-        for kwargs in (
-            {"agent_card": card, "memory": memory},
-            {"agent_card": card},
-        ):
+        for with_memory in (True, False):
             try:
-                agent = BeeA2AAgent(**kwargs)  # type: ignore[call-arg]
-                return _post_construct_fixups(agent, card_url)
+                if with_memory:
+                    return attempt(lambda url, mem, card=None: BeeA2AAgent(agent_card=card or _require_card(url), memory=mem), card=card)  # type: ignore[call-arg]
+                return attempt(lambda url, mem, card=None: BeeA2AAgent(agent_card=card or _require_card(url)), card=card)  # type: ignore[call-arg]
             except TypeError as e:
-                _LOG.debug("BeeAI A2AAgent(**%r) signature mismatch: %r", kwargs, e)
+                _LOG.debug("BeeAI A2AAgent(agent_card=..., memory=%s) signature mismatch: %r", with_memory, e)
             except Exception as e:
-                _LOG.debug("BeeAI A2AAgent(**%r) failed: %r", kwargs, e)
+                _LOG.debug("BeeAI A2AAgent(agent_card=..., memory=%s) failed: %r", with_memory, e)
 
     raise RuntimeError(
         "Could not construct BeeAI A2AAgent with any known signatures. "
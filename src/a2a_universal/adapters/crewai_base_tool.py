@@ -9,10 +9,14 @@ except Exception:
         description: str = "A2A Hello tool"
         base_url: str = "http://localhost:8000"
         use_jsonrpc: bool = False
+        def __init__(self, **kwargs: Any) -> None:
+            # Keyword construction like the pydantic BaseTool; unset fields keep the class defaults.
+            for field, value in kwargs.items():
+                setattr(self, field, value)
         def run(self, *args: Any, **kwargs: Any) -> Any:  # pragma: no cover
             return self._run(*args, **kwargs)
 
-from ..client import A2AClient
+from ..client import shared_client
 
 class A2AHelloTool(BaseTool):
     name: str = "a2a_hello"
@@ -21,4 +25,4 @@ class A2AHelloTool(BaseTool):
     use_jsonrpc: bool = False
 
     def _run(self, text: str) -> str:
-        return A2AClient(self.base_url).send(text, use_jsonrpc=self.use_jsonrpc)
+        return shared_client(self.base_url).send(text, use_jsonrpc=self.use_jsonrpc)
@@ -4,6 +4,10 @@ CrewAI-compatible wrapper for invoking Universal A2A Agent skills.
 
 - Uses Pydantic model fields (no custom __init__) to avoid attribute errors.
 - Provides both sync (_run) and async (_arun) execution paths.
+- Both paths share the pooled keep-alive clients of a2a_universal.http. Against
+  an https:// server they negotiate HTTP/2 (h2 ships with the core install), so
+  concurrent _arun calls multiplex over one connection; plain http:// stays on
+  HTTP/1.1 and spreads them over the pool.
 - Declares an args_schema so CrewAI knows how to pass inputs.
 - Includes sane defaults, timeouts, and robust error handling.
 """
@@ -11,11 +15,15 @@ CrewAI-compatible wrapper for invoking Universal A2A Agent skills.
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional, Type
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
 
 import httpx
 from crewai.tools import BaseTool
 
+from .._json import dumps as _dumps, loads as _loads, split_around
+from ..http import get_async_client, get_client
+
 # Pydantic v2 first; fall back to v1 for broader compatibility.
 try:  # Pydantic v2
     from pydantic import BaseModel, Field, model_validator
@@ -26,15 +34,47 @@ except Exception:  # Pydantic v1
 
     _PYDANTIC_V2 = False
 
-
 __all__ = ["A2ATool", "A2AInput", "a2a_hello"]
 
 
 # ----------------------------- Constants -------------------------------------
 
-_DEFAULT_BASE_URL = os.getenv("A2A_BASE", "http://localhost:8000")
+# Stored normalized, so the validators only re-normalize values that differ from them.
+_DEFAULT_BASE_URL = os.getenv("A2A_BASE", "http://localhost:8000").rstrip("/")
 _DEFAULT_ENDPOINT_PATH = "/a2a"
 _DEFAULT_TIMEOUT_SECONDS = 30.0
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=256)
+def _payload_envelope(message_id: str, skill: Optional[str]) -> Tuple[bytes, bytes]:
+    """
+    Encode the A2A message payload for one tool once, split around the prompt.
+
+    Everything but the prompt is fixed per (messageId, skill), so a call only
+    JSON-encodes the prompt and joins it between the two cached byte halves.
+    """
+
+    def encode(prompt: str) -> bytes:
+        return _dumps({
+            "method": "message/send",
+            "params": {
+                "message": {
+                    "role": "user",
+                    "messageId": message_id,
+                    "parts": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "data",
+                            "mimeType": "application/vnd.a2a-skill",
+                            "data": skill,
+                        },
+                    ],
+                }
+            },
+        })
+
+    return split_around(encode)
 
 
 # ------------------------------ Schemas --------------------------------------
@@ -87,8 +127,10 @@ class A2ATool(BaseTool):
             if not self.skill:
                 self.skill = self.name
             # Normalize base_url and endpoint path
-            self.base_url = self.base_url.rstrip("/")
-            self.endpoint_path = "/" + self.endpoint_path.lstrip("/")
+            if self.base_url != _DEFAULT_BASE_URL:
+                self.base_url = self.base_url.rstrip("/")
+            if self.endpoint_path != _DEFAULT_ENDPOINT_PATH:
+                self.endpoint_path = "/" + self.endpoint_path.lstrip("/")
             return self
     else:  # Pydantic v1 compatibility
         @root_validator(pre=False)  # type: ignore[misc]
@@ -97,33 +139,22 @@ class A2ATool(BaseTool):
             name = values.get("name")
             if not skill and name:
                 values["skill"] = name
-            base_url = (values.get("base_url") or _DEFAULT_BASE_URL).rstrip("/")
-            endpoint = "/" + (values.get("endpoint_path") or _DEFAULT_ENDPOINT_PATH).lstrip("/")
+            base_url = values.get("base_url") or _DEFAULT_BASE_URL
+            if base_url != _DEFAULT_BASE_URL:
+                base_url = base_url.rstrip("/")
+            endpoint = values.get("endpoint_path") or _DEFAULT_ENDPOINT_PATH
+            if endpoint != _DEFAULT_ENDPOINT_PATH:
+                endpoint = "/" + endpoint.lstrip("/")
             values["base_url"] = base_url
             values["endpoint_path"] = endpoint
             return values
 
     # ------------------------ Internal helpers -------------------------------
 
-    def _make_payload(self, prompt: str) -> Dict[str, Any]:
-        """Construct the A2A message payload."""
-        return {
-            "method": "message/send",
-            "params": {
-                "message": {
-                    "role": "user",
-                    "messageId": f"{self.name}-tool",
-                    "parts": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "data",
-                            "mimeType": "application/vnd.a2a-skill",
-                            "data": self.skill,
-                        },
-                    ],
-                }
-            },
-        }
+    def _make_payload(self, prompt: str) -> bytes:
+        """Construct the A2A message payload as JSON bytes."""
+        head, tail = _payload_envelope(f"{self.name}-tool", self.skill)
+        return head + _dumps(prompt) + tail
 
     def _build_url(self) -> str:
         """Join base_url and endpoint_path safely."""
@@ -134,12 +165,13 @@ class A2ATool(BaseTool):
         """
         Try to extract the most useful text from a few likely shapes.
         """
-        # Preferred A2A message.parts[text]
-        message = (data.get("message") or {})
-        for part in message.get("parts", []):
-            if part.get("type") == "text":
+        # Preferred A2A message.parts[text]: the common case, checked first and
+        # returned from directly; the other shapes are only probed on a miss.
+        message = data.get("message")
+        if message:
+            for part in message.get("parts") or ():
                 text = part.get("text")
-                if isinstance(text, str) and text.strip():
+                if part.get("type") == "text" and isinstance(text, str) and text.strip():
                     return text
 
         # Common fallbacks
@@ -173,10 +205,11 @@ class A2ATool(BaseTool):
         """
         payload = self._make_payload(prompt)
         try:
-            response = httpx.post(
+            # Shared per-base pool: repeated tool calls reuse the keep-alive connection.
+            response = get_client(self.base_url).post(
                 self._build_url(),
-                json=payload,
-                headers={"Content-Type": "application/json"},
+                content=payload,
+                headers=_JSON_HEADERS,
                 timeout=httpx.Timeout(self.request_timeout),
             )
             response.raise_for_status()
@@ -193,7 +226,7 @@ class A2ATool(BaseTool):
 
         # Parse structured response
         try:
-            data = response.json()
+            data = _loads(response.content)
         except ValueError:
             return "[A2A call failed: invalid JSON response]"
 
@@ -207,14 +240,14 @@ class A2ATool(BaseTool):
         """
         payload = self._make_payload(prompt)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self._build_url(),
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=httpx.Timeout(self.request_timeout),
-                )
-                response.raise_for_status()
+            # Shared per-base AsyncClient for this event loop: keep-alive across async tool calls.
+            response = await get_async_client(self.base_url).post(
+                self._build_url(),
+                content=payload,
+                headers=_JSON_HEADERS,
+                timeout=httpx.Timeout(self.request_timeout),
+            )
+            response.raise_for_status()
         except httpx.TimeoutException as exc:
             return f"[A2A call failed: timeout after {self.request_timeout:.1f}s: {exc}]"
         except httpx.HTTPStatusError as exc:
@@ -226,7 +259,7 @@ class A2ATool(BaseTool):
             return f"[A2A call failed: unexpected error: {exc}]"
 
         try:
-            data = response.json()
+            data = _loads(response.content)
         except ValueError:
             return "[A2A call failed: invalid JSON response]"
 
@@ -234,10 +267,23 @@ class A2ATool(BaseTool):
 
 
 # -------------------------------------------------------------------
-# Example pre-built tool (hello-world)
+# Example pre-built tool (hello-world), built on first access
 # -------------------------------------------------------------------
-a2a_hello = A2ATool(
-    name="a2a_hello",
-    description="Send a greeting to the Universal A2A Agent and return its reply.",
-    skill="hello",
-)
+_a2a_hello: Optional[A2ATool] = None
+
+if TYPE_CHECKING:  # provided lazily by __getattr__ below
+    a2a_hello: A2ATool
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: importing A2ATool alone doesn't construct (and validate) the example tool.
+    global _a2a_hello
+    if name == "a2a_hello":
+        if _a2a_hello is None:
+            _a2a_hello = A2ATool(
+                name="a2a_hello",
+                description="Send a greeting to the Universal A2A Agent and return its reply.",
+                skill="hello",
+            )
+        return _a2a_hello
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,11 @@ LangChain tool(s) for calling the Universal A2A Agent.
 
 Design goals (prod-ready):
 - Single-input tool signature (compatible with Chat agents).
-- Reads config from environment (no leaking params into the tool signature).
+- Reads config from environment once (no leaking params into the tool signature).
 - Sensible defaults + overridable via env vars.
 - Input validation, clear errors, minimal & safe logging.
-- Small retry loop for transient network hiccups.
+- Small retry loop (exponential backoff, full jitter) for transient network hiccups.
+- Native async path (`a2a_acall`), used by the tools when agents run via ainvoke.
 - One-time /readyz preflight with framework mismatch warnings.
 - Backwards-compatible export: `a2a_hello`.
 
@@ -16,6 +17,7 @@ ENV VARS (all optional unless noted):
 - A2A_USE_JSONRPC      : "true"/"false" to use /rpc JSON-RPC route (default: false -> /a2a route)
 - A2A_TIMEOUT_SEC      : Request timeout in seconds (default: 30)
 - A2A_RETRIES          : Number of quick retries on failure (default: 2)
+- A2A_RETRY_CAP_MS     : Upper bound of the jittered exponential retry backoff (default: 5000)
 - A2A_TOOL_DEBUG       : "true" to enable DEBUG logs for this module (default: false)
 - A2A_TOOL_PREFLIGHT   : "true" to run a one-time /readyz preflight (default: true)
 
@@ -30,71 +32,86 @@ You can also create a custom-named tool:
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 import time
-from threading import Lock
-from typing import Callable
+from functools import lru_cache
+from threading import Event, Lock
+from typing import Callable, NamedTuple
 
 import httpx
-from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 
-from ..client import A2AClient
+from ..client import A2AClient, shared_client
+from ._common import CREWAI_RE, backoff, bool_env, float_env, int_env, is_retryable
 
-__all__ = ["a2a_hello", "a2a_call", "make_a2a_tool"]
+__all__ = ["a2a_hello", "a2a_call", "a2a_acall", "make_a2a_tool", "refresh_debug_flag"]
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
 
 _LOG = logging.getLogger(__name__)
-if os.getenv("A2A_TOOL_DEBUG", "").strip().lower() in {"1", "true", "yes", "y"}:
+if bool_env("A2A_TOOL_DEBUG"):
     # Don't clobber root handlers; just set level on this logger.
     _LOG.setLevel(logging.DEBUG)
 
+# Debug state, sampled at import so the hot path tests a plain bool (no timing
+# calls when off). Call refresh_debug_flag() after reconfiguring logging.
+_DEBUG = _LOG.isEnabledFor(logging.DEBUG)
+
+
+def refresh_debug_flag() -> bool:
+    """Re-read whether this module logs at DEBUG; returns the new value."""
+    global _DEBUG
+    _DEBUG = _LOG.isEnabledFor(logging.DEBUG)
+    return _DEBUG
+
 
 # ---------------------------------------------------------------------------
 # Env helpers
 # ---------------------------------------------------------------------------
 
-def _bool_env(name: str, default: bool = False) -> bool:
-    v = os.getenv(name)
-    if v is None:
-        return default
-    return v.strip().lower() in {"1", "true", "yes", "y"}
-
+def _base_url() -> str:
+    return os.getenv("A2A_BASE_URL", "http://localhost:8000").rstrip("/")
 
-def _int_env(name: str, default: int) -> int:
-    v = os.getenv(name)
-    if v is None:
-        return default
-    try:
-        return int(v)
-    except Exception:
-        return default
 
+class _Config(NamedTuple):
+    base_url: str
+    use_jsonrpc: bool
+    timeout_sec: float
+    retries: int
+    retry_cap_ms: int
 
-def _float_env(name: str, default: float) -> float:
-    v = os.getenv(name)
-    if v is None:
-        return default
-    try:
-        return float(v)
-    except Exception:
-        return default
 
+@lru_cache(maxsize=1)
+def _config() -> _Config:
+    """
+    Tool configuration, read from the environment on first use.
 
-def _base_url() -> str:
-    return os.getenv("A2A_BASE_URL", "http://localhost:8000").rstrip("/")
+    The env is treated as fixed once the process runs; call ``_config.cache_clear()``
+    after changing it (e.g. in tests).
+    """
+    return _Config(
+        base_url=_base_url(),
+        use_jsonrpc=bool_env("A2A_USE_JSONRPC", False),
+        timeout_sec=float_env("A2A_TIMEOUT_SEC", 30.0),
+        retries=max(int_env("A2A_RETRIES", 2), 0),
+        retry_cap_ms=int_env("A2A_RETRY_CAP_MS", 5000),
+    )
 
 
 # ---------------------------------------------------------------------------
 # One-time /readyz preflight (warn if server uses CrewAI framework)
 # ---------------------------------------------------------------------------
 
-_PREFLIGHT_DONE = False
+# Set once the preflight has run; later calls only test the event. The first
+# caller takes the lock and runs the check; callers arriving meanwhile wait for
+# the event (at most _PREFLIGHT_WAIT_SEC) so none proceeds before the warning.
+_PREFLIGHT_EVENT = Event()
 _PREFLIGHT_LOCK = Lock()
+_PREFLIGHT_WAIT_SEC = 5.0
 
 
 def _preflight_readyz(base_url: str, *, context: str = "LangChain tool") -> None:
@@ -102,21 +119,18 @@ def _preflight_readyz(base_url: str, *, context: str = "LangChain tool") -> None
     Best-effort preflight to detect server framework mismatch.
     Warn (do not raise) if the server looks configured for CrewAI.
     """
-    global _PREFLIGHT_DONE
-    if _PREFLIGHT_DONE:
+    if _PREFLIGHT_EVENT.is_set():
         return
-    with _PREFLIGHT_LOCK:
-        if _PREFLIGHT_DONE:
-            return
-        if not _bool_env("A2A_TOOL_PREFLIGHT", True):
-            _PREFLIGHT_DONE = True
+    if not _PREFLIGHT_LOCK.acquire(blocking=False):
+        _PREFLIGHT_EVENT.wait(_PREFLIGHT_WAIT_SEC)
+        return
+    try:
+        if not bool_env("A2A_TOOL_PREFLIGHT", True):
             return
         try:
             r = httpx.get(f"{base_url}/readyz", timeout=5.0)
             if r.status_code == 200:
-                data = r.json()
-                text = json.dumps(data).lower()
-                if "crewai" in text:
+                if CREWAI_RE.search(r.content):
                     # Match the phrasing used in the LangGraph node, tailored for LangChain.
                     _LOG.warning(
                         "[WARN] A2A server looks configured for CrewAI. "
@@ -127,14 +141,89 @@ def _preflight_readyz(base_url: str, *, context: str = "LangChain tool") -> None
                 _LOG.debug("Preflight /readyz returned HTTP %s; continuing.", r.status_code)
         except Exception as e:  # noqa: BLE001
             _LOG.debug("Preflight /readyz skipped due to error: %r", e)
-        finally:
-            _PREFLIGHT_DONE = True
+    finally:
+        _PREFLIGHT_EVENT.set()
+        _PREFLIGHT_LOCK.release()
 
 
 # ---------------------------------------------------------------------------
 # Core callable (plain function you can also import & use directly)
 # ---------------------------------------------------------------------------
 
+def _prepare(text: str) -> tuple[A2AClient, str, bool, float, int]:
+    """Validate *text*, read the env config, run the preflight; shared by a2a_call/a2a_acall."""
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("a2a_call(text): `text` must be a non-empty string.")
+
+    base_url, use_jsonrpc, timeout_sec, retries, _ = _config()
+
+    # One-time preflight
+    _preflight_readyz(base_url, context="LangChain tool")
+
+    client = shared_client(base_url)
+    return client, base_url, use_jsonrpc, timeout_sec, retries
+
+
+def _reply(resp: object) -> str:
+    """Normalize a client reply into the tool's return string."""
+    # If server returned a framework error string, log and return a concise hint.
+    if isinstance(resp, str) and resp.startswith("[crewai error]"):
+        _LOG.warning("A2A server reported CrewAI error; ensure AGENT_FRAMEWORK=native on the server.")
+        return "Server is running CrewAI framework; set AGENT_FRAMEWORK=native on the A2A server."
+
+    # Defensive: ensure we return a string
+    if isinstance(resp, str) and resp.strip():
+        return resp
+    # Client guarantees string, but keep a guard:
+    return str(resp) if resp is not None else "[A2A: no text in response]"
+
+
+def _log_start(base_url: str, use_jsonrpc: bool, timeout_sec: float, attempt: int) -> None:
+    if _DEBUG:
+        _LOG.debug(
+            "A2A call start: base_url=%s route=%s timeout=%.1fs attempt=%d",
+            base_url,
+            "JSON-RPC" if use_jsonrpc else "A2A",
+            timeout_sec,
+            attempt + 1,
+        )
+
+
+def _retry_or_raise(e: Exception, attempt: int, retries: int) -> float:
+    """Return the backoff (seconds) before the next attempt, or raise if *e* is final."""
+    if attempt < retries and is_retryable(e):
+        delay = backoff(attempt, _config().retry_cap_ms)
+        _LOG.warning(
+            "A2A call failed (attempt %d/%d): %s — retrying in %d ms",
+            attempt + 1,
+            retries + 1,
+            type(e).__name__,
+            delay * 1000.0,
+        )
+        return delay
+    # Exhausted, or not worth retrying
+    _LOG.error("A2A call failed after %d attempts: %s", attempt + 1, repr(e))
+    raise RuntimeError(f"A2A call failed: {type(e).__name__}: {e}") from e
+
+
+def _send(client: A2AClient, text: str, use_jsonrpc: bool, timeout: float) -> str:
+    if not _DEBUG:
+        return _reply(client.send(text, use_jsonrpc=use_jsonrpc, timeout=timeout))
+    t0 = time.perf_counter()
+    resp = client.send(text, use_jsonrpc=use_jsonrpc, timeout=timeout)
+    _LOG.debug("A2A call OK in %.1f ms", (time.perf_counter() - t0) * 1000.0)
+    return _reply(resp)
+
+
+async def _asend(client: A2AClient, text: str, use_jsonrpc: bool, timeout: float) -> str:
+    if not _DEBUG:
+        return _reply(await client.asend(text, use_jsonrpc=use_jsonrpc, timeout=timeout))
+    t0 = time.perf_counter()
+    resp = await client.asend(text, use_jsonrpc=use_jsonrpc, timeout=timeout)
+    _LOG.debug("A2A call OK in %.1f ms", (time.perf_counter() - t0) * 1000.0)
+    return _reply(resp)
+
+
 def a2a_call(text: str) -> str:
     """
     Send a user message to the Universal A2A Agent and return its text reply.
@@ -157,62 +246,44 @@ def a2a_call(text: str) -> str:
     RuntimeError
         If all retry attempts fail due to transport or server errors.
     """
-    if not isinstance(text, str) or not text.strip():
-        raise ValueError("a2a_call(text): `text` must be a non-empty string.")
-
-    base_url = _base_url()
-    use_jsonrpc = _bool_env("A2A_USE_JSONRPC", False)
-    timeout_sec = _float_env("A2A_TIMEOUT_SEC", 30.0)
-    retries = _int_env("A2A_RETRIES", 2)
-
-    # One-time preflight
-    _preflight_readyz(base_url, context="LangChain tool")
+    client, base_url, use_jsonrpc, timeout_sec, retries = _prepare(text)
+    # First attempt straight-line; the retry loop only runs after a failure.
+    _log_start(base_url, use_jsonrpc, timeout_sec, 0)
+    try:
+        return _send(client, text, use_jsonrpc, timeout_sec)
+    except Exception as e:  # noqa: BLE001
+        last: Exception = e
+    for attempt in range(retries):
+        time.sleep(_retry_or_raise(last, attempt, retries))
+        _log_start(base_url, use_jsonrpc, timeout_sec, attempt + 1)
+        try:
+            return _send(client, text, use_jsonrpc, timeout_sec)
+        except Exception as e:  # noqa: BLE001
+            last = e
+    _retry_or_raise(last, retries, retries)  # raises
+    raise AssertionError("unreachable")  # pragma: no cover
 
-    client = A2AClient(base_url, timeout=timeout_sec)  # `timeout` supported by client
 
-    last_err: Exception | None = None
-    for attempt in range(retries + 1):
+async def a2a_acall(text: str) -> str:
+    """
+    Async twin of :func:`a2a_call`: same config, retries and errors, but the
+    request runs on the event loop (``A2AClient.asend``) instead of a thread.
+    """
+    client, base_url, use_jsonrpc, timeout_sec, retries = _prepare(text)
+    _log_start(base_url, use_jsonrpc, timeout_sec, 0)
+    try:
+        return await _asend(client, text, use_jsonrpc, timeout_sec)
+    except Exception as e:  # noqa: BLE001
+        last: Exception = e
+    for attempt in range(retries):
+        await asyncio.sleep(_retry_or_raise(last, attempt, retries))
+        _log_start(base_url, use_jsonrpc, timeout_sec, attempt + 1)
         try:
-            if _LOG.isEnabledFor(logging.DEBUG):
-                _LOG.debug(
-                    "A2A call start: base_url=%s route=%s timeout=%.1fs attempt=%d",
-                    base_url,
-                    "JSON-RPC" if use_jsonrpc else "A2A",
-                    timeout_sec,
-                    attempt + 1,
-                )
-            t0 = time.perf_counter()
-            resp = client.send(text, use_jsonrpc=use_jsonrpc)
-            dt = (time.perf_counter() - t0) * 1000.0
-            if _LOG.isEnabledFor(logging.DEBUG):
-                _LOG.debug("A2A call OK in %.1f ms", dt)
-
-            # If server returned a framework error string, log and return a concise hint.
-            if isinstance(resp, str) and resp.startswith("[crewai error]"):
-                _LOG.warning("A2A server reported CrewAI error; ensure AGENT_FRAMEWORK=native on the server.")
-                return "Server is running CrewAI framework; set AGENT_FRAMEWORK=native on the A2A server."
-
-            # Defensive: ensure we return a string
-            if isinstance(resp, str) and resp.strip():
-                return resp
-            # Client guarantees string, but keep a guard:
-            return str(resp) if resp is not None else "[A2A: no text in response]"
+            return await _asend(client, text, use_jsonrpc, timeout_sec)
         except Exception as e:  # noqa: BLE001
-            last_err = e
-            if attempt < retries:
-                backoff_ms = 100 * (attempt + 1)  # light linear backoff
-                _LOG.warning(
-                    "A2A call failed (attempt %d/%d): %s — retrying in %d ms",
-                    attempt + 1,
-                    retries + 1,
-                    type(e).__name__,
-                    backoff_ms,
-                )
-                time.sleep(backoff_ms / 1000.0)
-                continue
-            # Exhausted
-            _LOG.error("A2A call failed after %d attempts: %s", retries + 1, repr(e))
-            raise RuntimeError(f"A2A call failed: {type(e).__name__}: {e}") from e
+            last = e
+    _retry_or_raise(last, retries, retries)  # raises
+    raise AssertionError("unreachable")  # pragma: no cover
 
 
 # ---------------------------------------------------------------------------
@@ -221,8 +292,7 @@ def a2a_call(text: str) -> str:
 #   - `return_direct=False` so the output flows back through the agent.
 # ---------------------------------------------------------------------------
 
-@tool("a2a_hello", return_direct=False)
-def a2a_hello(text: str) -> str:
+def _hello(text: str) -> str:
     """
     Send free-form text to the Universal A2A Agent and return its reply.
 
@@ -234,12 +304,24 @@ def a2a_hello(text: str) -> str:
     return a2a_call(text)
 
 
+async def _ahello(text: str) -> str:
+    return await a2a_acall(text)
+
+
+# Sync + native async implementation: agents driven by ainvoke/astream await
+# a2a_acall on the event loop instead of running a2a_call in a worker thread.
+a2a_hello = StructuredTool.from_function(
+    func=_hello, coroutine=_ahello, name="a2a_hello", return_direct=False
+)
+
+
 def make_a2a_tool(
     name: str = "a2a_call",
     description: str | None = None,
 ) -> Callable[[str], str]:
     """
-    Factory to create a single-input LangChain tool bound to `a2a_call`.
+    Factory to create a single-input LangChain tool bound to `a2a_call`
+    (and to `a2a_acall` for async agents).
 
     Parameters
     ----------
@@ -251,8 +333,8 @@ def make_a2a_tool(
     Returns
     -------
     Callable[[str], str]
-        A LangChain-compatible tool function (decorated) that accepts one
-        string argument and returns the agent's reply text.
+        A LangChain-compatible tool that accepts one string argument and
+        returns the agent's reply text.
     """
     if not description:
         description = (
@@ -260,11 +342,16 @@ def make_a2a_tool(
             "Input: the exact text to send."
         )
 
-    # We create a new function and decorate it with @tool at runtime.
+    # We create new functions and build the tool at runtime.
     # This avoids multi-input signatures and keeps per-tool naming.
     def _impl(text: str) -> str:
         return a2a_call(text)
 
+    async def _aimpl(text: str) -> str:
+        return await a2a_acall(text)
+
     _impl.__name__ = name  # helps with logs/debugging
     _impl.__doc__ = description
-    return tool(name=name, return_direct=False)(_impl)
+    return StructuredTool.from_function(
+        func=_impl, coroutine=_aimpl, name=name, description=description, return_direct=False
+    )
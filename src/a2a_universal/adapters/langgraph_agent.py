@@ -5,7 +5,8 @@ LangGraph node that calls the Universal A2A service.
 Goals (prod-ready):
 - Works across LangGraph versions (typed state fallback if MessagesState moved).
 - Safe defaults, overridable via environment variables.
-- Clear logging + small retry for transient HTTP hiccups.
+- Clear logging + small retry (exponential backoff, full jitter) for transient HTTP hiccups.
+- Native async path: app.ainvoke awaits the request instead of using a thread pool.
 - No multi-input surprises; only reads configuration from env/constructor.
 - Optional offline fallback for tests/CI (disabled by default for prod).
 
@@ -14,6 +15,7 @@ ENV (optional):
 - A2A_USE_JSONRPC       : "true"/"false" to use /rpc JSON-RPC route (default: false -> /a2a)
 - A2A_NODE_TIMEOUT_SEC  : Per-request timeout hint (not passed to client; used for logging) (default: 30)
 - A2A_NODE_RETRIES      : Number of quick retries on failure (default: 2)
+- A2A_RETRY_CAP_MS      : Upper bound of the jittered exponential retry backoff (default: 5000)
 - A2A_NODE_DEBUG        : "true" to enable DEBUG logs for this module (default: false)
 - A2A_OFFLINE_FALLBACK  : "true" to return a local echo on HTTP errors (default: false)
 
@@ -39,12 +41,12 @@ Usage (example):
 from __future__ import annotations
 
 import logging
-import os
 import time
+from functools import singledispatch
 from typing import Any, Dict, List, Optional
 
-import httpx
 from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import RunnableLambda
 
 # --- LangGraph state compatibility ------------------------------------------------
 # Prefer built-in MessagesState when available; otherwise define a typed state
@@ -54,57 +56,78 @@ try:
     from langgraph.graph import MessagesState  # type: ignore
 except Exception:  # pragma: no cover - only used on certain versions
     from typing_extensions import Annotated, TypedDict
-    from langgraph.graph.message import add_messages, AnyMessage
 
-    class MessagesState(TypedDict):  # type: ignore[no-redef]
-        messages: Annotated[List[AnyMessage], add_messages]
+    try:
+        from langgraph.graph.message import add_messages, AnyMessage
+
+        class MessagesState(TypedDict):  # type: ignore[no-redef]
+            messages: Annotated[List[AnyMessage], add_messages]
+    except ImportError:
+        # No langgraph: the node is still a plain Runnable over {"messages": [...]}.
+        class MessagesState(TypedDict):  # type: ignore[no-redef]
+            messages: List[Any]
 
-from ..client import A2AClient
+from ..client import shared_client
+from ._common import Outcome, asend_with_retries, bool_env, node_defaults, send_with_retries
 
-__all__ = ["A2AAgentNode", "MessagesState"]
+__all__ = ["A2AAgentNode", "MessagesState", "refresh_debug_flag"]
 
 # --- Logging ---------------------------------------------------------------------
 
 _LOG = logging.getLogger(__name__)
-if os.getenv("A2A_NODE_DEBUG", "").strip().lower() in {"1", "true", "yes", "y"}:
+if bool_env("A2A_NODE_DEBUG"):
     _LOG.setLevel(logging.DEBUG)
 
-
-# --- Env helpers -----------------------------------------------------------------
-
-def _bool_env(name: str, default: bool = False) -> bool:
-    v = os.getenv(name)
-    if v is None:
-        return default
-    return v.strip().lower() in {"1", "true", "yes", "y"}
+# Sampled once: per-attempt checks read this bool, and requests are only timed
+# when it is set. refresh_debug_flag() re-samples after logging is reconfigured.
+_DEBUG = _LOG.isEnabledFor(logging.DEBUG)
 
 
-def _int_env(name: str, default: int) -> int:
-    v = os.getenv(name)
-    if v is None:
-        return default
-    try:
-        return int(v)
-    except Exception:
-        return default
-
+def refresh_debug_flag() -> bool:
+    """Re-read whether this module logs at DEBUG; returns the new value."""
+    global _DEBUG
+    _DEBUG = _LOG.isEnabledFor(logging.DEBUG)
+    return _DEBUG
 
-def _float_env(name: str, default: float) -> float:
-    v = os.getenv(name)
-    if v is None:
-        return default
-    try:
-        return float(v)
-    except Exception:
-        return default
 
+# --- Message helpers --------------------------------------------------------------
 
-def _base_url(default: str = "http://localhost:8000") -> str:
-    return os.getenv("A2A_BASE_URL", default).rstrip("/")
+@singledispatch
+def _user_content(m: Any) -> Optional[str]:
+    """Text of *m* if it is a non-empty user message, else None (duck-typed fallback)."""
+    if getattr(m, "type", None) == "human":
+        content = getattr(m, "content", "")
+        if isinstance(content, str) and content.strip():
+            return content.strip()
+    return None
+
+
+@_user_content.register
+def _(m: BaseMessage) -> Optional[str]:
+    # LangChain BaseMessage path
+    if m.type == "human":
+        content = m.content
+        if isinstance(content, str) and content.strip():
+            return content.strip()
+    return None
+
+
+@_user_content.register
+def _(m: dict) -> Optional[str]:
+    # Dict-like fallback (OpenAI style)
+    if m.get("role") != "user":
+        return None
+    content = m.get("content", "")
+    if isinstance(content, str) and content.strip():
+        return content.strip()
+    if isinstance(content, list):
+        # [{"type":"text","text":"..."}] etc.
+        for part in content:
+            if isinstance(part, dict) and part.get("type") == "text" and part.get("text"):
+                return str(part["text"]).strip()
+    return None
 
 
-# --- Message helpers --------------------------------------------------------------
-
 def _last_user_text(messages: List[Any] | List[BaseMessage]) -> str:
     """
     Extract the most relevant user text from LangChain/BaseMessage or dict-style messages.
@@ -113,25 +136,11 @@ def _last_user_text(messages: List[Any] | List[BaseMessage]) -> str:
     # Walk backwards: prefer explicit human messages; then any text content.
     for m in reversed(messages or []):
         try:
-            # LangChain BaseMessage path
-            if hasattr(m, "type") and getattr(m, "type") == "human":
-                content = getattr(m, "content", "")
-                if isinstance(content, str) and content.strip():
-                    return content.strip()
-            # Dict-like fallback (OpenAI style)
-            if isinstance(m, dict):
-                role = m.get("role")
-                content = m.get("content", "")
-                if role == "user":
-                    if isinstance(content, str) and content.strip():
-                        return content.strip()
-                    if isinstance(content, list):
-                        # [{"type":"text","text":"..."}] etc.
-                        for part in content:
-                            if isinstance(part, dict) and part.get("type") == "text" and part.get("text"):
-                                return str(part["text"]).strip()
+            text = _user_content(m)
         except Exception:
             continue
+        if text is not None:
+            return text
     # If nothing found, best-effort: stringify last element
     if messages:
         last = messages[-1]
@@ -142,11 +151,16 @@ def _last_user_text(messages: List[Any] | List[BaseMessage]) -> str:
 
 # --- Node ------------------------------------------------------------------------
 
-class A2AAgentNode:
+class A2AAgentNode(RunnableLambda):
     """LangGraph node that wraps the Universal A2A service.
 
     By default, reads base URL and behavior flags from environment variables.
     See module docstring for the full list of recognized env vars.
+
+    The node is a Runnable with a sync and a native async implementation:
+    ``app.invoke`` calls :meth:`__call__`, while ``app.ainvoke``/``astream``
+    await :meth:`acall` on the event loop instead of running the sync path in
+    a thread pool.
     """
 
     def __init__(
@@ -159,80 +173,100 @@ class A2AAgentNode:
         offline_fallback: Optional[bool] = None,
     ) -> None:
         # Configuration (env-driven with sane defaults)
-        self.base_url = (base_url or _base_url())
-        self.use_jsonrpc = (use_jsonrpc if use_jsonrpc is not None else _bool_env("A2A_USE_JSONRPC", False))
-        self.timeout_sec = (timeout_sec if timeout_sec is not None else _float_env("A2A_NODE_TIMEOUT_SEC", 30.0))
-        self.retries = (retries if retries is not None else _int_env("A2A_NODE_RETRIES", 2))
+        env = node_defaults()
+        self.base_url = (base_url or env.base_url)
+        self.use_jsonrpc = (use_jsonrpc if use_jsonrpc is not None else env.use_jsonrpc)
+        self.timeout_sec = (timeout_sec if timeout_sec is not None else env.timeout_sec)
+        self.retries = (retries if retries is not None else env.retries)
         self.offline_fallback = (offline_fallback
                                  if offline_fallback is not None
-                                 else _bool_env("A2A_OFFLINE_FALLBACK", False))
+                                 else env.offline_fallback)
 
-        # Client: keep constructor minimal to avoid coupling to client kwargs that might not exist.
-        self.client = A2AClient(self.base_url)
+        # Client: shared by every node and tool on this base URL.
+        self.client = shared_client(self.base_url)
+        super().__init__(self.__call__, afunc=self.acall, name=type(self).__name__)
 
         _LOG.info(
-            "A2AAgentNode initialized base_url=%s jsonrpc=%s retries=%d timeout=%.1fs offline_fallback=%s",
-            self.base_url, self.use_jsonrpc, self.retries, self.timeout_sec, self.offline_fallback,
+            "%s initialized base_url=%s jsonrpc=%s retries=%d timeout=%.1fs offline_fallback=%s",
+            type(self).__name__, self.base_url, self.use_jsonrpc, self.retries, self.timeout_sec,
+            self.offline_fallback,
         )
 
-    def __call__(self, state: MessagesState) -> Dict[str, Any]:
-        """LangGraph node entry point: consumes state, returns a dict with new messages."""
-        messages = state.get("messages", [])  # type: ignore[assignment]
-        user_text = _last_user_text(messages)
+    # -- shared pieces of the sync and async paths ---------------------------------
 
-        # Guard empty prompts (avoid sending empty requests downstream)
-        if not isinstance(user_text, str) or not user_text.strip():
-            _LOG.debug("No user text found in state; returning empty AI message.")
-            return {"messages": [AIMessage(content="")]}
+    @staticmethod
+    def _reply_update(reply: Any, t0: Optional[float]) -> Dict[str, Any]:
+        if t0 is not None:
+            _LOG.debug("A2A response OK in %.1f ms", (time.perf_counter() - t0) * 1000.0)
+
+        # If server returned a framework error string, log and return a concise hint.
+        if isinstance(reply, str) and reply.startswith("[crewai error]"):
+            _LOG.warning(
+                "A2A server reported CrewAI error; ensure AGENT_FRAMEWORK=native on the server."
+            )
+            concise = "Server is running CrewAI framework; set AGENT_FRAMEWORK=native on the A2A server."
+            return {"messages": [AIMessage(content=concise)]}
 
-        # Simple retry loop around the A2A call
-        last_exc: Optional[Exception] = None
-        for attempt in range(self.retries + 1):
-            try:
-                if _LOG.isEnabledFor(logging.DEBUG):
-                    _LOG.debug(
-                        "A2A request start: route=%s attempt=%d/%d",
-                        "JSON-RPC" if self.use_jsonrpc else "A2A",
-                        attempt + 1,
-                        self.retries + 1,
-                    )
-                t0 = time.perf_counter()
-                reply = self.client.send(user_text, use_jsonrpc=self.use_jsonrpc)
-                dt_ms = (time.perf_counter() - t0) * 1000.0
-                if _LOG.isEnabledFor(logging.DEBUG):
-                    _LOG.debug("A2A response OK in %.1f ms", dt_ms)
-
-                # If server returned a framework error string, log and return a concise hint.
-                if isinstance(reply, str) and reply.startswith("[crewai error]"):
-                    _LOG.warning(
-                        "A2A server reported CrewAI error; ensure AGENT_FRAMEWORK=native on the server."
-                    )
-                    concise = "Server is running CrewAI framework; set AGENT_FRAMEWORK=native on the A2A server."
-                    return {"messages": [AIMessage(content=concise)]}
-
-                # Defensive: ensure a string; client should already do this.
-                text = reply if isinstance(reply, str) else (str(reply) if reply is not None else "")
-                return {"messages": [AIMessage(content=text)]}
-            except httpx.HTTPError as e:
-                last_exc = e
-                _LOG.warning("A2A HTTP error (%s) on attempt %d/%d", e.__class__.__name__, attempt + 1, self.retries + 1)
-            except Exception as e:  # noqa: BLE001
-                last_exc = e
-                _LOG.warning("A2A call failed (%s) on attempt %d/%d", e.__class__.__name__, attempt + 1, self.retries + 1)
-
-            # Backoff before retrying
-            if attempt < self.retries:
-                backoff_ms = 100 * (attempt + 1)
-                time.sleep(backoff_ms / 1000.0)
-
-        # All attempts failed
+        # Defensive: ensure a string; client should already do this.
+        text = reply if isinstance(reply, str) else (str(reply) if reply is not None else "")
+        return {"messages": [AIMessage(content=text)]}
+
+    def _failed_update(self, user_text: str, last_exc: Optional[Exception], attempts: int) -> Dict[str, Any]:
+        # All attempts failed (or the error was not retryable)
         if self.offline_fallback:
             _LOG.error("A2A call failed after %d attempts; returning offline fallback. Last error: %r",
-                       self.retries + 1, last_exc)
+                       attempts, last_exc)
             msg = f"Hello (offline), you said: {user_text}" if user_text else "Hello, World!"
             return {"messages": [AIMessage(content=msg)]}
 
         # Propagate a clear error message into the graph (no exception to keep graph running)
-        err = f"A2A call failed after {self.retries + 1} attempt(s): {type(last_exc).__name__}: {last_exc}"
+        err = f"A2A call failed after {attempts} attempt(s): {type(last_exc).__name__}: {last_exc}"
         _LOG.error(err)
         return {"messages": [AIMessage(content=err)]}
+
+    def _user_text(self, state: MessagesState) -> Optional[str]:
+        user_text = _last_user_text(state.get("messages", []))  # type: ignore[arg-type]
+
+        # Guard empty prompts (avoid sending empty requests downstream)
+        if not isinstance(user_text, str) or not user_text.strip():
+            _LOG.debug("No user text found in state; returning empty AI message.")
+            return None
+        return user_text
+
+    def _send(self, user_text: str) -> Outcome:
+        """Send *user_text* with the retry policy; the outcome carries the reply or the last error."""
+        return send_with_retries(
+            self.client, user_text, use_jsonrpc=self.use_jsonrpc, retries=self.retries,
+            retry_cap_ms=node_defaults().retry_cap_ms, log=_LOG, debug=_DEBUG,
+        )
+
+    async def _asend(self, user_text: str) -> Outcome:
+        """Async twin of :meth:`_send`, on ``A2AClient.asend``."""
+        return await asend_with_retries(
+            self.client, user_text, use_jsonrpc=self.use_jsonrpc, retries=self.retries,
+            retry_cap_ms=node_defaults().retry_cap_ms, log=_LOG, debug=_DEBUG,
+        )
+
+    # -- entry points ----------------------------------------------------------------
+
+    def __call__(self, state: MessagesState) -> Dict[str, Any]:
+        """LangGraph node entry point: consumes state, returns a dict with new messages."""
+        user_text = self._user_text(state)
+        if user_text is None:
+            return {"messages": [AIMessage(content="")]}
+
+        out = self._send(user_text)
+        if out.error is None:
+            return self._reply_update(out.reply, out.t0)
+        return self._failed_update(user_text, out.error, out.attempts)
+
+    async def acall(self, state: MessagesState) -> Dict[str, Any]:
+        """Async twin of :meth:`__call__`, sending with ``A2AClient.asend``."""
+        user_text = self._user_text(state)
+        if user_text is None:
+            return {"messages": [AIMessage(content="")]}
+
+        out = await self._asend(user_text)
+        if out.error is None:
+            return self._reply_update(out.reply, out.t0)
+        return self._failed_update(user_text, out.error, out.attempts)
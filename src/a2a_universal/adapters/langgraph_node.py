@@ -1,13 +1,46 @@
 from __future__ import annotations
+import logging
 from typing import Dict, Any
-from ..client import A2AClient
+from ..client import shared_client
+from ._common import asend_with_retries, node_defaults, send_with_retries
+
+_LOG = logging.getLogger(__name__)
 
 class A2ANode:
+    """
+    Minimal LangGraph node for ``{"input": ...}`` states; adds ``a2a_reply``.
+
+    ``invoke``/``__call__`` block on :meth:`A2AClient.send`; ``ainvoke``/``acall``
+    await :meth:`A2AClient.asend` so async graphs don't stall the event loop. To
+    give a graph both paths: ``g.add_node("a2a", RunnableLambda(node, afunc=node.acall))``.
+
+    Transient failures are retried like in A2AAgentNode (A2A_NODE_RETRIES,
+    A2A_RETRY_CAP_MS); a call that still fails raises. Needs no langchain install.
+    """
+
     def __init__(self, base_url: str = "http://localhost:8000", use_jsonrpc: bool = False):
-        self.client = A2AClient(base_url)
+        self.base_url = base_url
+        self.client = shared_client(base_url)
         self.use_jsonrpc = use_jsonrpc
+        self.retries = node_defaults().retries
 
     def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        text = state.get("input", "")
-        reply = self.client.send(text, use_jsonrpc=self.use_jsonrpc)
-        return {**state, "a2a_reply": reply}
+        out = send_with_retries(
+            self.client, state.get("input", ""), use_jsonrpc=self.use_jsonrpc, retries=self.retries,
+            retry_cap_ms=node_defaults().retry_cap_ms, log=_LOG,
+        )
+        if out.error is not None:
+            raise out.error
+        return {**state, "a2a_reply": out.reply}
+
+    async def acall(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        out = await asend_with_retries(
+            self.client, state.get("input", ""), use_jsonrpc=self.use_jsonrpc, retries=self.retries,
+            retry_cap_ms=node_defaults().retry_cap_ms, log=_LOG,
+        )
+        if out.error is not None:
+            raise out.error
+        return {**state, "a2a_reply": out.reply}
+
+    invoke = __call__
+    ainvoke = acall
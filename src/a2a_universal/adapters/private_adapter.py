@@ -8,15 +8,21 @@ OUTPUT_KEY = os.getenv("PRIVATE_ADAPTER_OUTPUT_KEY", "output")
 TRACE_KEY = os.getenv("PRIVATE_ADAPTER_TRACE_KEY", "traceId")
 
 
-def extract_user_text(body: Dict[str, Any]) -> str:
-    if isinstance(body, dict) and INPUT_KEY in body and isinstance(body[INPUT_KEY], str):
-        return body[INPUT_KEY]
+def extract_user_text(body: Dict[str, Any], _input_key: str = INPUT_KEY) -> str:
+    # Common case first: a single lookup of the configured input key.
+    try:
+        value = body[_input_key]
+        if isinstance(value, str):
+            return value
+    except (KeyError, TypeError, IndexError):
+        pass
     messages = body.get("messages") if isinstance(body, dict) else None
     if isinstance(messages, list):
         for m in reversed(messages):
-            role = (m or {}).get("role")
-            content = (m or {}).get("content")
-            if role == "user":
+            if not m:
+                continue
+            if m.get("role") == "user":
+                content = m.get("content")
                 if isinstance(content, str):
                     return content
                 if isinstance(content, list):
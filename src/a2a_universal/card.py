@@ -1,6 +1,18 @@
 ## `src/a2a_universal/card.py`
+import hashlib
 import os
+from functools import lru_cache
 
+from ._json import dumps as _dumps
+
+
+# How long clients may reuse the card before revalidating it (Cache-Control max-age).
+CARD_MAX_AGE = 60
+
+# The card only depends on env vars that are fixed once the process starts, so it
+# is built once; call clear_card_cache() after changing them (e.g. in tests).
+# Treat the returned dict as read-only.
+@lru_cache(maxsize=1)
 def agent_card():
     base = os.getenv("PUBLIC_URL", "http://localhost:8000")
     return {
@@ -23,3 +35,21 @@ def agent_card():
         ]
     }
 
+
+@lru_cache(maxsize=1)
+def agent_card_json() -> bytes:
+    """The agent card encoded as JSON, ready to be sent as a response body."""
+    return _dumps(agent_card())
+
+
+@lru_cache(maxsize=1)
+def agent_card_etag() -> str:
+    """Strong ETag of :func:`agent_card_json`, for If-None-Match revalidation."""
+    return '"%s"' % hashlib.sha256(agent_card_json()).hexdigest()[:32]
+
+
+def clear_card_cache() -> None:
+    """Rebuild the card (and its JSON and ETag) on next use."""
+    agent_card.cache_clear()
+    agent_card_json.cache_clear()
+    agent_card_etag.cache_clear()
@@ -1,28 +1,192 @@
 from __future__ import annotations
+import asyncio
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+
 import httpx
-from typing import Dict, Any
+
+from ._json import dumps as _dumps, loads as _loads, split_around
+from .http import LIMITS, aclose_all, close_all, get_async_client, get_client
+from .models import A2AParams, A2ARequest, JSONRPCRequest, Message, TextPart
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def request_envelope(message_id: str, jsonrpc: bool = False) -> Tuple[bytes, bytes]:
+    """
+    Encode a ``message/send`` request once and split it around the text value.
+
+    Only the user text changes between calls, so a request body is
+    ``head + json(text) + tail`` instead of a fresh dict and a full encode.
+    """
+
+    def encode(text: str) -> bytes:
+        params = A2AParams(message=Message(role="user", messageId=message_id, parts=[TextPart(text=text)]))
+        req = JSONRPCRequest(id="1", method="message/send", params=params) if jsonrpc else A2ARequest(method="message/send", params=params)
+        return req.model_dump_json().encode()
+
+    return split_around(encode)
+
+
+_A2A_ENVELOPE = request_envelope("cli")
+_RPC_ENVELOPE = request_envelope("cli", jsonrpc=True)
+
 
 class A2AClient:
-    def __init__(self, base_url: str):
+    """
+    Minimal client for an A2A server: :meth:`send`, :meth:`asend` for event loops, and
+    :meth:`send_many` for concurrent batches.
+
+    Instances talking to the same *base_url* share one pooled httpx.Client, and
+    one AsyncClient per event loop (see a2a_universal.http). *http2* and *max_keepalive* tune that pool and
+    take effect for the first client created for a base URL; *timeout* is the
+    default per-request timeout of :meth:`send`, and *use_jsonrpc* its default
+    route (``/rpc`` instead of ``/a2a``).
+
+    HTTP/2 is used over https when h2 is installed (httpx negotiates it via TLS
+    ALPN); an ``http://`` base URL always talks HTTP/1.1 over keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        http2: Optional[bool] = None,
+        max_keepalive: Optional[int] = None,
+        timeout: float = 20.0,
+        use_jsonrpc: bool = False,
+    ):
         self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.use_jsonrpc = use_jsonrpc
+        # Route and envelope of the default mode are bound once; the other mode
+        # is still available per call.
+        self._a2a_url = f"{self.base_url}/a2a"
+        self._rpc_url = f"{self.base_url}/rpc"
+        self._url = self._rpc_url if use_jsonrpc else self._a2a_url
+        self._head, self._tail = _RPC_ENVELOPE if use_jsonrpc else _A2A_ENVELOPE
+        limits = None if max_keepalive is None else httpx.Limits(max_keepalive_connections=max_keepalive, max_connections=LIMITS.max_connections)
+        self._http2 = http2
+        self._limits = limits
+
+    @property
+    def _client(self) -> httpx.Client:
+        # Looked up per request so a client survives close_all(): the next send reopens the pool.
+        return get_client(self.base_url, http2=self._http2, limits=self._limits)
+
+    def close(self) -> None:
+        """
+        Release what this instance owns, which is nothing: the pool is shared by
+        every client, adapter and node talking to the same base URL, so closing
+        it here would break their requests in flight. Use :meth:`close_all` (or
+        ``a2a_universal.http.close_client``) to tear pools down.
+        """
+
+    def __enter__(self) -> "A2AClient":
+        return self
 
-    def send(self, text: str, use_jsonrpc: bool = False, timeout: float = 20.0) -> str:
-        if use_jsonrpc:
-            payload: Dict[str, Any] = {
-                "jsonrpc": "2.0", "id": "1", "method": "message/send",
-                "params": {"message": {"role": "user", "messageId": "cli", "parts": [{"type": "text", "text": text}]}}
-            }
-            url = f"{self.base_url}/rpc"
-        else:
-            payload = {"method": "message/send", "params": {"message": {"role": "user", "messageId": "cli", "parts": [{"type": "text", "text": text}]}}}
-            url = f"{self.base_url}/a2a"
-        r = httpx.post(url, json=payload, timeout=timeout)
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled connection (also runs at interpreter exit)."""
+        close_all()
+
+    def _request(self, text: str, use_jsonrpc: Optional[bool]) -> Tuple[str, bytes]:
+        if use_jsonrpc is None or use_jsonrpc == self.use_jsonrpc:
+            return self._url, self._head + _dumps(text) + self._tail
+        head, tail = _RPC_ENVELOPE if use_jsonrpc else _A2A_ENVELOPE
+        return (self._rpc_url if use_jsonrpc else self._a2a_url), head + _dumps(text) + tail
+
+    @staticmethod
+    def _reply_text(r: httpx.Response) -> str:
         r.raise_for_status()
-        data = r.json()
-        if "result" in data and isinstance(data["result"], dict):
-            data = data["result"]
-        parts = (data.get("message") or {}).get("parts", [])
-        for p in parts:
-            if p.get("type") == "text":
-                return p.get("text", "")
+        data: Dict[str, Any] = _loads(r.content)
+        result = data.get("result")
+        if isinstance(result, dict):
+            data = result
+        # Explicit isinstance branches (no `or {}` temporaries) keep the types
+        # narrow for mypyc; see `make compile-client`.
+        msg = data.get("message")
+        if not isinstance(msg, dict):
+            return ""
+        parts = msg.get("parts")
+        if not parts:
+            return ""
+        # Replies nearly always carry the text in the first part: index it directly
+        # and only scan the rest for multi-part replies.
+        p0 = parts[0]
+        if isinstance(p0, dict) and p0.get("type") == "text":
+            text: str = p0.get("text", "")
+            return text
+        for p in parts[1:]:
+            if isinstance(p, dict) and p.get("type") == "text":
+                text = p.get("text", "")
+                return text
         return ""
+
+    def send(self, text: str, use_jsonrpc: Optional[bool] = None, timeout: Optional[float] = None) -> str:
+        url, body = self._request(text, use_jsonrpc)
+        # Shared per-base pool: every adapter talking to this server reuses its connections.
+        r = self._client.post(url, content=body, headers=_JSON_HEADERS, timeout=self.timeout if timeout is None else timeout)
+        return self._reply_text(r)
+
+    async def asend(self, text: str, use_jsonrpc: Optional[bool] = None, timeout: Optional[float] = None) -> str:
+        """Async twin of :meth:`send`, on the shared AsyncClient of the running event loop."""
+        url, body = self._request(text, use_jsonrpc)
+        client = get_async_client(self.base_url, http2=self._http2, limits=self._limits)
+        r = await client.post(url, content=body, headers=_JSON_HEADERS, timeout=self.timeout if timeout is None else timeout)
+        return self._reply_text(r)
+
+    async def send_many(
+        self,
+        texts: Iterable[str],
+        use_jsonrpc: Optional[bool] = None,
+        max_concurrency: int = 8,
+    ) -> List[Union[str, BaseException]]:
+        """
+        Send independent prompts concurrently and return the replies in input order.
+
+        At most *max_concurrency* requests are in flight; they share the pooled
+        AsyncClient, so the batch reuses warm connections. A failed prompt yields
+        its exception in place of the reply instead of cancelling the batch.
+        """
+        sem = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def one(text: str) -> str:
+            async with sem:
+                return await self.asend(text, use_jsonrpc=use_jsonrpc)
+
+        return await asyncio.gather(*(one(t) for t in texts), return_exceptions=True)
+
+    def send_many_sync(
+        self,
+        texts: Iterable[str],
+        use_jsonrpc: Optional[bool] = None,
+        max_concurrency: int = 8,
+    ) -> List[Union[str, BaseException]]:
+        """Blocking :meth:`send_many` for code without an event loop (runs its own via asyncio.run)."""
+
+        async def run() -> List[Union[str, BaseException]]:
+            try:
+                return await self.send_many(texts, use_jsonrpc=use_jsonrpc, max_concurrency=max_concurrency)
+            finally:
+                await aclose_all()
+
+        return asyncio.run(run())
+
+
+@lru_cache(maxsize=32)
+def _shared_client(base_url: str) -> A2AClient:
+    return A2AClient(base_url)
+
+
+def shared_client(base_url: str) -> A2AClient:
+    """
+    The process-wide A2AClient for *base_url* (default options).
+
+    Adapters and tools use this instead of building a client per call or per
+    instance; pass a per-call ``timeout`` to :meth:`A2AClient.send` when needed.
+    """
+    return _shared_client(base_url.rstrip("/"))
@@ -0,0 +1,335 @@
+"""
+Shared A2A call helpers for the example scripts.
+
+Every quickstart used to carry its own copy of ``a2a_call``/``a2a_send``. They
+now import these helpers, so one pooled sync client, one async client, and one
+pre-encoded request envelope are shared by whatever runs in the process.
+
+Env:
+- A2A_BASE        : Base URL of the A2A server (default: http://localhost:8000)
+- XDG_RUNTIME_DIR : Where the /readyz probe result is cached (fallback: ~/.cache/a2a)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from . import http as _http
+from ._json import dumps as _dumps, loads as _loads
+from .client import request_envelope
+
+# ijson lets the streaming helpers parse reply parts incrementally; without it
+# they fall back to parsing the buffered body once it has arrived.
+try:
+    import ijson  # type: ignore
+except ImportError:  # optional (pip install -e .[speedups])
+    ijson = None
+
+# libuv-backed event loop for run(); stock asyncio when missing or on Windows.
+try:
+    import uvloop  # type: ignore
+except ImportError:  # optional (pip install -e .[uvloop])
+    uvloop = None
+
+_T = TypeVar("_T")
+
+__all__ = [
+    "base_url",
+    "A2ACallError",
+    "JSON_HEADERS",
+    "encode_message",
+    "parse_reply",
+    "send_sync",
+    "send_async",
+    "a2a_call_sync",
+    "a2a_call_async",
+    "a2a_acall_many",
+    "get_client",
+    "get_async_client",
+    "aclose",
+    "lifespan",
+    "run",
+    "a2a_stream",
+    "a2a_astream",
+    "readyz",
+]
+
+# Pool size, HTTP/2 and the per-phase HTTP_TIMEOUTS live in a2a_universal.http.
+PROBE_TIMEOUTS = httpx.Timeout(connect=2.0, read=5.0, write=5.0, pool=5.0)
+
+# The request body is pre-encoded once; each call only JSON-encodes the user text.
+_BODY_HEAD, _BODY_TAIL = request_envelope("example")
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Connect failures are retried by the shared transport (same pool, no agent rerun);
+# overloaded backends answering 429/503 get a short exponential backoff with jitter.
+_STREAM_CHUNK = 8192
+_RETRY_STATUS = frozenset({429, 503})
+_RETRY_ATTEMPTS = 4
+_RETRY_INITIAL = 0.2
+_RETRY_MAX = 2.0
+
+
+def base_url() -> str:
+    """A2A server URL; read when the clients are created, so a later load_dotenv() still applies."""
+    return os.getenv("A2A_BASE", "http://localhost:8000").rstrip("/")
+
+
+class A2ACallError(Exception):
+    """The A2A call failed; ``str(exc)`` is a bracketed, printable message."""
+
+
+# ----------------------------- Clients ---------------------------------------
+
+def get_client() -> httpx.Client:
+    """Return the shared sync client for the A2A server (see a2a_universal.http)."""
+    return _http.get_client(base_url())
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient; create it inside the running event loop."""
+    return _http.get_async_client(base_url())
+
+
+async def aclose() -> None:
+    """Close the shared AsyncClients; call before the event loop shuts down."""
+    await _http.aclose_all()
+
+
+@asynccontextmanager
+async def lifespan() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Open the shared AsyncClient for the duration of an async run and close it after.
+
+    Mirrors a FastAPI lifespan: ``async with lifespan(): await app.ainvoke(...)``.
+    """
+    try:
+        yield get_async_client()
+    finally:
+        await aclose()
+
+
+def run(coro: Awaitable[_T]) -> _T:
+    """``asyncio.run(coro)``, on uvloop when installed (not on Windows)."""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.run(coro)  # type: ignore[no-any-return]
+    return asyncio.run(coro)  # type: ignore[arg-type]
+
+
+# ----------------------------- Helpers ---------------------------------------
+
+def encode_message(text: str) -> bytes:
+    """Return the ``message/send`` request body for *text* as JSON bytes."""
+    return _BODY_HEAD + _dumps(text) + _BODY_TAIL
+
+
+def parse_reply(content: bytes) -> str:
+    """Return the first text part of an A2A reply body; raise A2ACallError if there is none."""
+    data = _loads(content)
+    # Fast path: the server puts the reply text in the first part.
+    try:
+        first = data["message"]["parts"][0]
+        if first["type"] == "text":
+            return first["text"]
+    except (KeyError, IndexError, TypeError):
+        pass
+    for p in (data.get("message") or {}).get("parts", []):
+        if p.get("type") == "text":
+            return p.get("text", "")
+    raise A2ACallError("[No text part in A2A response]")
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff (0.2s, 0.4s, 0.8s, ... capped at 2s) with +/-50% jitter."""
+    return min(_RETRY_MAX, _RETRY_INITIAL * 2 ** attempt) * (0.5 + random.random())
+
+
+def _reply_text(r: httpx.Response) -> str:
+    r.raise_for_status()
+    return parse_reply(r.content)
+
+
+def _failure(e: Exception) -> A2ACallError:
+    if isinstance(e, httpx.ConnectError):
+        return A2ACallError(f"[A2A call failed: could not connect to {base_url()}. Is the server running (`make run`)?]")
+    if isinstance(e, httpx.HTTPStatusError):
+        return A2ACallError(f"[A2A call failed: HTTP {e.response.status_code}: {e.response.text[:512]}]")
+    return A2ACallError(f"[A2A call failed: {e}]")
+
+
+def send_sync(text: str) -> str:
+    """Send *text* to ``/a2a`` and return the reply text; raise A2ACallError on failure."""
+    try:
+        client, body = get_client(), encode_message(text)
+        for attempt in range(_RETRY_ATTEMPTS):
+            r = client.post("/a2a", content=body, headers=JSON_HEADERS)
+            if r.status_code not in _RETRY_STATUS or attempt == _RETRY_ATTEMPTS - 1:
+                break
+            time.sleep(_retry_delay(attempt))
+        return _reply_text(r)
+    except A2ACallError:
+        raise
+    except Exception as e:
+        raise _failure(e) from e
+
+
+async def send_async(text: str) -> str:
+    """Async twin of :func:`send_sync`."""
+    try:
+        client, body = get_async_client(), encode_message(text)
+        for attempt in range(_RETRY_ATTEMPTS):
+            r = await client.post("/a2a", content=body, headers=JSON_HEADERS)
+            if r.status_code not in _RETRY_STATUS or attempt == _RETRY_ATTEMPTS - 1:
+                break
+            await asyncio.sleep(_retry_delay(attempt))
+        return _reply_text(r)
+    except A2ACallError:
+        raise
+    except Exception as e:
+        raise _failure(e) from e
+
+
+def a2a_call_sync(prompt: str) -> str:
+    """Tool-friendly wrapper: return the reply text, or the error as a string."""
+    try:
+        return send_sync(prompt)
+    except A2ACallError as e:
+        return str(e)
+
+
+async def a2a_call_async(prompt: str) -> str:
+    """Tool-friendly async wrapper: return the reply text, or the error as a string."""
+    try:
+        return await send_async(prompt)
+    except A2ACallError as e:
+        return str(e)
+
+
+async def a2a_acall_many(prompts: Iterable[str]) -> List[str]:
+    """Send independent prompts concurrently on the shared AsyncClient; replies keep input order."""
+    return list(await asyncio.gather(*(a2a_call_async(p) for p in prompts)))
+
+
+# ----------------------------- Streaming -------------------------------------
+
+def _text_parts(parts: Iterable[Any]) -> Iterator[str]:
+    for p in parts:
+        if isinstance(p, dict) and p.get("type") == "text":
+            yield p.get("text", "")
+
+
+def a2a_stream(prompt: str) -> Iterator[str]:
+    """
+    Yield the reply's text parts as they are parsed off the wire.
+
+    Reads the body in 8 KiB chunks; with ``ijson`` installed each part is
+    yielded as soon as it is complete instead of after the whole body.
+    Raises A2ACallError on failure.
+    """
+    try:
+        with get_client().stream("POST", "/a2a", content=encode_message(prompt), headers=JSON_HEADERS) as r:
+            if r.is_error:
+                r.read()
+            r.raise_for_status()
+            if ijson is None:
+                yield from _text_parts((_loads(r.read()).get("message") or {}).get("parts", []))
+                return
+            parsed = ijson.sendable_list()
+            coro = ijson.items_coro(parsed, "message.parts.item")
+            for chunk in r.iter_bytes(_STREAM_CHUNK):
+                coro.send(chunk)
+                yield from _text_parts(parsed)
+                del parsed[:]
+            coro.close()
+            yield from _text_parts(parsed)
+    except A2ACallError:
+        raise
+    except Exception as e:
+        raise _failure(e) from e
+
+
+async def a2a_astream(prompt: str) -> AsyncIterator[str]:
+    """Async twin of :func:`a2a_stream` on the shared AsyncClient."""
+    try:
+        async with get_async_client().stream("POST", "/a2a", content=encode_message(prompt), headers=JSON_HEADERS) as r:
+            if r.is_error:
+                await r.aread()
+            r.raise_for_status()
+            if ijson is None:
+                for text in _text_parts((_loads(await r.aread()).get("message") or {}).get("parts", [])):
+                    yield text
+                return
+            parsed = ijson.sendable_list()
+            coro = ijson.items_coro(parsed, "message.parts.item")
+            async for chunk in r.aiter_bytes(_STREAM_CHUNK):
+                coro.send(chunk)
+                for text in _text_parts(parsed):
+                    yield text
+                del parsed[:]
+            coro.close()
+            for text in _text_parts(parsed):
+                yield text
+    except A2ACallError:
+        raise
+    except Exception as e:
+        raise _failure(e) from e
+
+
+# ----------------------------- Preflight -------------------------------------
+
+def _readyz_cache_file(base: str) -> Path:
+    root = os.getenv("XDG_RUNTIME_DIR")
+    folder = Path(root, "a2a") if root else Path.home() / ".cache" / "a2a"
+    return folder / f"readyz-{hashlib.blake2b(base.encode()).hexdigest()[:16]}"
+
+
+def readyz(base: str, ttl: float = 30.0) -> Optional[Tuple[int, bytes]]:
+    """
+    Return ``(status_code, body)`` of ``GET {base}/readyz``, or None if unreachable.
+
+    A 200 younger than *ttl* seconds is read back from a small cache file, so
+    repeated script launches in a dev loop skip the HTTP probe entirely. Misses
+    go through the pooled client for *base*; other statuses are never cached,
+    so a server that is still starting up is probed again next time.
+    """
+    base = base.rstrip("/")
+    path = _readyz_cache_file(base)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            status, _, body = path.read_bytes().partition(b"\n")
+            return int(status), body
+    except (OSError, ValueError):
+        pass
+
+    try:
+        r = _http.get_client(base).get(f"{base}/readyz", timeout=PROBE_TIMEOUTS)
+    except Exception:  # noqa: BLE001 - unreachable server is not cached
+        return None
+    if r.status_code != 200:
+        return r.status_code, r.content
+
+    # Atomic replace: concurrent launches never read a half-written file.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(b"%d\n" % r.status_code + r.content)
+            os.replace(tmp, path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+    return r.status_code, r.content
@@ -31,4 +31,4 @@ class Framework(FrameworkBase):
 
     async def execute(self, messages: list[dict[str, Any]]) -> str:
         text = _extract_last_user_text(messages)
-        return await _call_provider(self.provider, text, messages)
+        return await _call_provider(self.provider, text, messages, self._gen_coro)
@@ -32,7 +32,7 @@ class Framework(FrameworkBase):
             try:
                 # Define a simple tool that uses our provider
                 async def a2a_tool(query: str) -> str:
-                    return await _call_provider(self.provider, query, messages)
+                    return await _call_provider(self.provider, query, messages, self._gen_coro)
 
                 # CrewAI tools are usually sync; provide a sync adapter
                 def a2a_tool_sync(query: str) -> str:
@@ -46,4 +46,4 @@ class Framework(FrameworkBase):
             except Exception as e:
                 return f"[crewai error] {e}"
         # Fallback path
-        return await _call_provider(self.provider, text, messages)
+        return await _call_provider(self.provider, text, messages, self._gen_coro)
@@ -19,7 +19,7 @@ class Framework(FrameworkBase):
             async def node(state: dict[str, Any]) -> dict[str, Any]:
                 last = state["messages"][-1]
                 user_text = getattr(last, "content", "")
-                reply = await _call_provider(self.provider, user_text, [])
+                reply = await _call_provider(self.provider, user_text, [], self._gen_coro)
                 return {"messages": [AIMessage(content=reply)]}
 
             sg.add_node("a2a", node)
@@ -44,4 +44,4 @@ class Framework(FrameworkBase):
                 return f"[langgraph error] {e}"
         # Fallback
         text = _extract_last_user_text(messages)
-        return await _call_provider(self.provider, text, messages)
+        return await _call_provider(self.provider, text, messages, self._gen_coro)
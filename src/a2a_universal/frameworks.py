@@ -17,8 +17,11 @@ import inspect
 import os
 import pkgutil
 import asyncio
+import weakref
+from functools import cache, lru_cache
 from typing import Callable, Dict, Optional, Any
 
+from ._fast import extract_last_user_text
 from .providers import ProviderBase
 
 # ===== Base contract ============================================================
@@ -30,11 +33,15 @@ class FrameworkBase:
     name: str = "BaseFramework"
     ready: bool = False
     reason: str = "Not initialized"
+    # Whether provider.generate is async, fixed at construction; None (a plugin
+    # that skipped this __init__) makes _call_provider detect it per provider.
+    _gen_coro: Optional[bool] = None
 
     def __init__(self, provider: ProviderBase, **_: Any) -> None:
         self.provider = provider
         self.ready = True
         self.reason = ""
+        self._gen_coro = _provider_is_coro(provider)
 
     async def execute(self, messages: list[dict[str, Any]]) -> str:  # pragma: no cover - interface
         raise NotImplementedError
@@ -53,25 +60,51 @@ class NotReadyFramework(FrameworkBase):
     async def execute(self, messages: list[dict[str, Any]]) -> str:
         # Pragmatic fallback: call provider directly.
         text = _extract_last_user_text(messages)
-        return await _call_provider(self.provider, text, messages)
+        return await _call_provider(self.provider, text, messages, self._gen_coro)
 
 
 # ===== Async provider shim ======================================================
 
-async def _call_provider(provider: ProviderBase, prompt: str, messages: list[dict[str, Any]]) -> str:
+# Whether each provider's generate() is a coroutine function; inspected on first use.
+_IS_CORO: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
+def _provider_is_coro(provider: ProviderBase) -> bool:
+    """Whether ``provider.generate`` is a coroutine function (cached per provider)."""
+    try:
+        return _IS_CORO[provider]
+    except (KeyError, TypeError):
+        pass
+    # Bound methods can be inspected for coroutine signature safely.
+    is_coro = inspect.iscoroutinefunction(getattr(provider, "generate", None))
+    try:
+        _IS_CORO[provider] = is_coro
+    except TypeError:  # provider can't be weak-referenced: just don't cache
+        pass
+    return is_coro
+
+
+async def _call_provider(
+    provider: ProviderBase,
+    prompt: str,
+    messages: list[dict[str, Any]],
+    is_coro: Optional[bool] = None,
+) -> str:
     """
     Call provider.generate asynchronously, offloading sync providers to a thread.
 
     IMPORTANT: Do not call .generate() twice. Detect coroutine-ness up-front and
     either await directly or offload the single call to a worker thread.
+    Frameworks pass their ``_gen_coro`` as *is_coro* to skip the detection.
     """
     try:
         gen = getattr(provider, "generate", None)
         if gen is None or not callable(gen):
             return "[framework/provider error] provider has no callable 'generate'"
 
-        # Bound methods can be inspected for coroutine signature safely.
-        if inspect.iscoroutinefunction(gen):
+        if is_coro is None:
+            is_coro = _provider_is_coro(provider)
+        if is_coro:
             return await gen(prompt=prompt, messages=messages)  # type: ignore[misc]
         # Fallback: treat as sync, run once in a thread
         return await asyncio.to_thread(gen, prompt, messages)  # type: ignore[misc]
@@ -79,26 +112,8 @@ async def _call_provider(provider: ProviderBase, prompt: str, messages: list[dic
         return f"[framework/provider error] {e}"
 
 
-def _extract_last_user_text(messages: list[dict[str, Any]]) -> str:
-    """
-    Best-effort extraction of the latest user text from a universal message array.
-    Supports OpenAI-style {'role','content'} where content can be str or list parts.
-    """
-    if not isinstance(messages, list):
-        return ""
-    for m in reversed(messages):
-        role = (m or {}).get("role")
-        content = (m or {}).get("content")
-        if role == "user":
-            if isinstance(content, str) and content.strip():
-                return content
-            if isinstance(content, list):
-                for p in content:
-                    if isinstance(p, dict) and p.get("type") == "text":
-                        txt = p.get("text", "")
-                        if isinstance(txt, str) and txt.strip():
-                            return txt
-    return ""
+# Re-exported under its historical name; framework plugins import it from here.
+_extract_last_user_text = extract_last_user_text
 
 
 # ===== Plugin discovery =========================================================
@@ -108,6 +123,24 @@ Factory = Callable[[ProviderBase], FrameworkBase]
 
 
 def _safe_factory_from_module(module_name: str, fallback_id: str) -> Factory:
+    """
+    Return a factory for a plugin module that is imported on the first call.
+
+    Discovery therefore never imports a plugin's heavy dependencies (langgraph,
+    crewai, ...) unless that framework is actually built.
+    """
+    inner: Optional[Factory] = None
+
+    def _factory(provider: ProviderBase) -> FrameworkBase:
+        nonlocal inner
+        if inner is None:
+            inner = _factory_from_module(module_name, fallback_id)
+        return inner(provider)
+
+    return _factory
+
+
+def _factory_from_module(module_name: str, fallback_id: str) -> Factory:
     """Wrap import/instantiation errors into a NotReadyFramework with clear reason."""
     def _stub(provider: ProviderBase) -> FrameworkBase:
         return NotReadyFramework(provider, fallback_id, reason="Module missing Framework/get_framework")
@@ -145,6 +178,9 @@ def _safe_factory_from_module(module_name: str, fallback_id: str) -> Factory:
     return _stub
 
 
+# Discovery walks the plugin package and reads installed-distribution metadata,
+# so both scans run once per process; treat the returned dicts as read-only.
+@cache
 def _discover_builtin() -> Dict[str, Factory]:
     registry: Dict[str, Factory] = {}
     try:
@@ -164,6 +200,7 @@ def _discover_builtin() -> Dict[str, Factory]:
 try:  # Python 3.12 style
     from importlib.metadata import entry_points as _eps  # type: ignore
 
+    @cache
     def _discover_entry_points() -> Dict[str, Factory]:
         out: Dict[str, Factory] = {}
         try:
@@ -196,6 +233,7 @@ try:  # Python 3.12 style
             out[fid] = _factory
         return out
 except Exception:  # pragma: no cover
+    @cache
     def _discover_entry_points() -> Dict[str, Factory]:
         return {}
 
@@ -218,27 +256,47 @@ _ALIASES: Dict[str, str] = {
 
 
 def list_frameworks() -> Dict[str, str]:
-    """Return a map of discovered framework ids -> source ('builtin' or 'entrypoint')."""
-    out: Dict[str, str] = {}
-    for k in _discover_builtin().keys():
-        out[k] = "builtin"
-    for k in _discover_entry_points().keys():
-        out[k] = "entrypoint"
+    """
+    Return a map of discovered framework ids -> source ('builtin' or 'entrypoint').
+
+    Discovery is cached; ``_reset_caches()`` rescans (e.g. after installing a
+    plugin) and refreshes the registry used by build_framework.
+    """
+    out = dict.fromkeys(_discover_builtin(), "builtin")
+    out.update(dict.fromkeys(_discover_entry_points(), "entrypoint"))
     return out
 
 
+@lru_cache(maxsize=8)
+def _resolve(want: str) -> Optional[Factory]:
+    """Factory for a framework id (aliases applied), falling back to 'native'; None if neither exists."""
+    factory = _REGISTRY.get(_ALIASES.get(want, want))
+    if factory is None:
+        factory = _REGISTRY.get("native")
+    return factory
+
+
 def build_framework(provider: ProviderBase) -> FrameworkBase:
     """
     Build the framework selected by env `AGENT_FRAMEWORK` (defaults to 'native').
     Falls back to 'native' when the requested framework is unavailable.
+
+    Every call builds a new framework instance; only the id -> factory lookup
+    is cached (see :func:`_reset_caches`).
     """
     want = (os.getenv("AGENT_FRAMEWORK", "native") or "native").lower().strip()
-    want = _ALIASES.get(want, want)
-    factory = _REGISTRY.get(want)
-    if factory:
-        return factory(provider)
-
-    # Fallback chain
-    if "native" in _REGISTRY:
-        return _REGISTRY["native"](provider)
-    return NotReadyFramework(provider, want or "unknown", reason="No frameworks discovered")
+    factory = _resolve(want)
+    if factory is None:
+        want = _ALIASES.get(want, want)
+        return NotReadyFramework(provider, want or "unknown", reason="No frameworks discovered")
+    return factory(provider)
+
+
+def _reset_caches() -> None:
+    """Rescan plugin discovery and forget resolved factories (after installing a plugin, or in tests)."""
+    _discover_builtin.cache_clear()
+    _discover_entry_points.cache_clear()
+    _REGISTRY.clear()
+    _REGISTRY.update(_discover_builtin())
+    _REGISTRY.update(_discover_entry_points())
+    _resolve.cache_clear()
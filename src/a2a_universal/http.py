@@ -0,0 +1,156 @@
+"""
+Process-wide pooled httpx clients, one per A2A base URL.
+
+The A2AClient, the framework adapters and the example helpers all take their
+connection pool from here, so a process mixing frameworks still opens a
+single keep-alive pool (and pays one TLS handshake) per host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib.util
+from threading import Lock
+from typing import Dict, Optional
+
+import httpx
+
+__all__ = [
+    "HTTP2",
+    "LIMITS",
+    "HTTP_TIMEOUTS",
+    "get_client",
+    "get_async_client",
+    "set_client",
+    "set_async_client",
+    "close_client",
+    "close_all",
+    "aclose_all",
+]
+
+# HTTP/2 over https when h2 is installed: httpx negotiates it through TLS ALPN
+# (there is no cleartext h2c), so http:// servers always get HTTP/1.1 keep-alive.
+# `h2` ships with the core install (httpx[http2]); the probe keeps environments
+# with a bare httpx working.
+HTTP2 = importlib.util.find_spec("h2") is not None
+LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+# Per-phase timeouts, configured in one place: a dead host or an exhausted pool
+# fails within seconds, while slow model replies still get the full read budget.
+HTTP_TIMEOUTS = httpx.Timeout(connect=2.0, read=30.0, write=5.0, pool=5.0)
+# Connect failures are retried by the transport, inside the same pool.
+TRANSPORT_RETRIES = 3
+
+_CLIENTS: Dict[str, httpx.Client] = {}
+# Async connections belong to the event loop that opened them, so AsyncClients are
+# shared per loop; clients left behind by a finished asyncio.run() are dropped
+# the next time a client is created.
+_ASYNC_CLIENTS: Dict[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]] = {}
+_LOCK = Lock()
+
+
+def get_client(
+    base_url: str,
+    *,
+    http2: Optional[bool] = None,
+    limits: Optional[httpx.Limits] = None,
+    timeout: Optional[httpx.Timeout] = None,
+) -> httpx.Client:
+    """
+    Return the shared sync client for *base_url*, creating it on first use.
+
+    *http2*, *limits* and *timeout* (default: HTTP2, LIMITS, HTTP_TIMEOUTS)
+    configure the client when this call creates it; an existing client is
+    returned as is.
+    """
+    key = base_url.rstrip("/")
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                transport = httpx.HTTPTransport(
+                    http2=HTTP2 if http2 is None else http2 and HTTP2,
+                    limits=limits or LIMITS,
+                    retries=TRANSPORT_RETRIES,
+                )
+                client = _CLIENTS[key] = httpx.Client(base_url=key, timeout=timeout or HTTP_TIMEOUTS, transport=transport)
+    return client
+
+
+def set_client(base_url: str, client: httpx.Client) -> None:
+    """Install *client* as the shared sync client for *base_url* (e.g. one owned by a script or test), closing the one it replaces."""
+    key = base_url.rstrip("/")
+    with _LOCK:
+        old = _CLIENTS.get(key)
+        _CLIENTS[key] = client
+    if old is not None and old is not client:
+        old.close()
+
+
+def get_async_client(
+    base_url: str,
+    *,
+    http2: Optional[bool] = None,
+    limits: Optional[httpx.Limits] = None,
+    timeout: Optional[httpx.Timeout] = None,
+) -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient for *base_url* on the running event loop, creating it on first use.
+
+    The keyword options work as in :func:`get_client`. Call :func:`aclose_all`
+    before the loop shuts down to close its connections cleanly.
+    """
+    loop = asyncio.get_running_loop()
+    key = base_url.rstrip("/")
+    clients = _ASYNC_CLIENTS.get(loop)
+    client = clients.get(key) if clients is not None else None
+    if client is None:
+        with _LOCK:
+            for stale in [other for other in _ASYNC_CLIENTS if other.is_closed()]:
+                del _ASYNC_CLIENTS[stale]
+            clients = _ASYNC_CLIENTS.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                transport = httpx.AsyncHTTPTransport(
+                    http2=HTTP2 if http2 is None else http2 and HTTP2,
+                    limits=limits or LIMITS,
+                    retries=TRANSPORT_RETRIES,
+                )
+                client = clients[key] = httpx.AsyncClient(base_url=key, timeout=timeout or HTTP_TIMEOUTS, transport=transport)
+    return client
+
+
+def set_async_client(base_url: str, client: httpx.AsyncClient) -> None:
+    """Install *client* as the shared AsyncClient for *base_url* on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        _ASYNC_CLIENTS.setdefault(loop, {})[base_url.rstrip("/")] = client
+
+
+def close_client(base_url: str) -> None:
+    """Close the shared sync client for *base_url*, if any; the next get_client() opens a fresh pool."""
+    with _LOCK:
+        client = _CLIENTS.pop(base_url.rstrip("/"), None)
+    if client is not None:
+        client.close()
+
+
+def close_all() -> None:
+    """Close every shared sync client (registered to run at interpreter exit)."""
+    with _LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_all() -> None:
+    """Close every shared AsyncClient of the running event loop."""
+    with _LOCK:
+        clients = list(_ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        await client.aclose()
+
+
+atexit.register(close_all)
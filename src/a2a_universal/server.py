@@ -24,7 +24,7 @@ from .models import (
     JSONRPCSuccess,
     JSONRPCError,
 )
-from .card import agent_card
+from .card import CARD_MAX_AGE, agent_card_etag, agent_card_json
 from .adapters import private_adapter as pad
 
 
@@ -190,10 +190,25 @@ async def readyz(req: Request) -> JSONResponse:
     return JSONResponse(payload, status_code=200 if ok else 503, headers=_with_diag_headers(rid))
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """True if an If-None-Match header lists *etag* (weak comparison) or is ``*``."""
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == tag for t in if_none_match.split(","))
+
+
 @app.get("/.well-known/agent-card.json")
-async def card(req: Request) -> JSONResponse:
+async def card(req: Request) -> Response:
     rid = _request_id(req)
-    return JSONResponse(agent_card(), headers=_with_diag_headers(rid))
+    etag = agent_card_etag()
+    # The card is fixed for the life of the process: let clients cache it and
+    # revalidate with If-None-Match instead of re-downloading it.
+    headers = {**_with_diag_headers(rid), "ETag": etag, "Cache-Control": f"max-age={CARD_MAX_AGE}"}
+    if _etag_matches(req.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    # Pre-encoded once per process: no per-request dict build or JSON encode.
+    return Response(agent_card_json(), media_type="application/json", headers=headers)
 
 
 # =============================================================================
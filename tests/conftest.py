@@ -0,0 +1,50 @@
+# tests/conftest.py
+import inspect
+
+import httpx
+import pytest
+
+from a2a_universal import http
+
+
+def _reply(text):
+    return httpx.Response(200, json={"message": {"role": "agent", "parts": [{"type": "text", "text": text}]}})
+
+
+class MockServer:
+    """Requests to *base* are recorded in ``seen``; queued ``replies`` are served first, then ``respond(request)``."""
+
+    def __init__(self, base, respond):
+        self.base, self.respond = base, respond
+        self.seen, self.replies = [], []
+
+    def _handle(self, request):
+        self.seen.append(request)
+        return self.replies.pop(0) if self.replies else self.respond(request)
+
+    async def _ahandle(self, request):
+        self.seen.append(request)
+        if self.replies:
+            return self.replies.pop(0)
+        out = self.respond(request)
+        return await out if inspect.isawaitable(out) else out
+
+    def serve_async(self):
+        """Also route *base* for the running event loop; close it with ``http.aclose_all()``."""
+        http.set_async_client(self.base, httpx.AsyncClient(transport=httpx.MockTransport(self._ahandle)))
+
+
+@pytest.fixture
+def mock_server():
+    """``mock_server(base, respond)`` routes the shared sync client for *base* through a MockTransport."""
+    servers = []
+
+    def start(base, respond=lambda request: _reply("ok")):
+        server = MockServer(base, respond)
+        http.set_client(base, httpx.Client(transport=httpx.MockTransport(server._handle)))
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        http.close_client(server.base)
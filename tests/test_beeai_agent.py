@@ -0,0 +1,165 @@
+# tests/test_beeai_agent.py
+import re
+
+import httpx
+import pytest
+
+from a2a_universal._json import dumps
+from a2a_universal.adapters.beeai_agent import _alias_keys, _to_snake
+
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _to_snake_ref(s):
+    # The original regex implementation the single-pass version must match.
+    if "-" in s or " " in s:
+        s = s.replace("-", "_").replace(" ", "_")
+    s = _CAMEL_SPLIT_RE.sub("_", s).lower()
+    return re.sub(r"__+", "_", s)
+
+
+def _alias_keys_ref(obj):
+    if isinstance(obj, list):
+        return [_alias_keys_ref(x) for x in obj]
+    if not isinstance(obj, dict):
+        return obj
+    out = {}
+    for k, v in obj.items():
+        out[k] = _alias_keys_ref(v)
+        snake = _to_snake_ref(k)
+        if snake != k and snake not in out:
+            out[snake] = _alias_keys_ref(v)
+    return out
+
+
+@pytest.mark.parametrize("key", [
+    "", "name", "preferredTransport", "PreferredTransport", "URL", "getHTTPResponse",
+    "kebab-case-key", "with space", "a__b", "_private", "__dunder__", "-Lead", "trailing_",
+    "a_B", "a-_-B", "x1Y2", "Äpfel", "grüßGott", "ÜberCool", "naïveKey", "ΣίσυφοςΑ", "İstanbul", "ǅemal",
+])
+def test_to_snake_matches_regex_version(key):
+    assert _to_snake.__wrapped__(key) == _to_snake_ref(key)
+
+
+def test_to_snake_matches_regex_version_for_every_bmp_character():
+    for cp in range(0x10000):
+        c = chr(cp)
+        for key in (c, "a" + c, c + "b", "aB" + c):
+            assert _to_snake.__wrapped__(key) == _to_snake_ref(key), repr(key)
+
+
+def test_alias_keys_matches_recursive_version():
+    card = {
+        "name": "agent",
+        "preferredTransport": "JSONRPC",
+        "preferred_transport": "kept",
+        "skills": [{"skillId": "s1", "inputModes": ["text"], "nested": {"deepKey-Name": [1, {"ÄKey": None}]}}],
+        "capabilities": {"streaming": False, "pushNotifications": True},
+        "empty": [],
+        "list-of-lists": [[{"innerKey": 1}], []],
+    }
+    out = _alias_keys(card)
+    assert out == _alias_keys_ref(card)
+    assert dumps(out) == dumps(_alias_keys_ref(card))  # same key order too
+    assert out["preferred_transport"] == "kept"
+    assert out["skills"][0]["skill_id"] == "s1"
+
+
+def test_alias_keys_returns_snake_case_trees_as_is():
+    card = {"name": "agent", "skills": [{"id": "s1"}]}
+    assert _alias_keys(card) is card
+    assert _alias_keys([card, 1]) == _alias_keys_ref([card, 1])
+
+
+CARD_URL = "http://card.test/.well-known/agent-card.json"
+
+
+def _card(request):
+    headers = {"ETag": '"v1"', "Cache-Control": "max-age=30"}
+    if request.headers.get("if-none-match") == '"v1"':
+        return httpx.Response(304, headers=headers)
+    return httpx.Response(200, json={"name": "agent", "preferredTransport": "JSONRPC"}, headers=headers)
+
+
+@pytest.fixture
+def card_server(mock_server, monkeypatch):
+    """Serve a card at CARD_URL with a 30 s max-age and ETag; yields (requests seen, clock)."""
+    from a2a_universal.adapters import beeai_agent
+
+    clock = [1000.0]
+    monkeypatch.setattr(beeai_agent.time, "monotonic", lambda: clock[0])
+    server = mock_server("http://card.test", _card)
+    beeai_agent.clear_card_cache()
+    yield server.seen, clock
+    beeai_agent.clear_card_cache()
+
+
+def test_card_cache_honours_max_age_then_revalidates_with_etag(card_server):
+    from a2a_universal.adapters.beeai_agent import _fetch_agent_card, clear_card_cache
+
+    seen, clock = card_server
+    card = _fetch_agent_card(CARD_URL)
+    assert card["preferred_transport"] == "JSONRPC"
+
+    clock[0] += 29  # still fresh: no request
+    assert _fetch_agent_card(CARD_URL) is card
+    assert len(seen) == 1
+
+    clock[0] += 2  # stale: conditional GET, 304 keeps the cached card
+    assert _fetch_agent_card(CARD_URL) is card
+    assert seen[-1].headers["if-none-match"] == '"v1"'
+    clock[0] += 29
+    assert _fetch_agent_card(CARD_URL) is card
+    assert len(seen) == 2
+
+    clear_card_cache()
+    assert _fetch_agent_card(CARD_URL) == card
+    assert "if-none-match" not in seen[-1].headers
+
+
+def test_max_age_parsing():
+    from a2a_universal.adapters.beeai_agent import _CARD_TTL_SEC, _max_age
+
+    def resp(cc=None):
+        return httpx.Response(200, headers={"Cache-Control": cc} if cc else {})
+
+    assert _max_age(resp()) == _CARD_TTL_SEC
+    assert _max_age(resp("public, max-age=120")) == 120
+    assert _max_age(resp("no-cache")) == 0
+    assert _max_age(resp("max-age=oops")) == 0
+
+
+def test_card_based_ctor_fetches_once_and_replays_fall_back_without_a_card(monkeypatch):
+    from a2a_universal.adapters import beeai_agent
+
+    built = []
+
+    class FakeAgent:
+        def __init__(self, agent_card, memory=None):
+            assert agent_card is not None
+            built.append(agent_card)
+
+    cards = [{"name": "agent"}]
+    fetches = []
+
+    def fetch(url):
+        fetches.append(url)
+        return cards[0]
+
+    monkeypatch.setattr(beeai_agent, "BeeA2AAgent", FakeAgent)
+    monkeypatch.setattr(beeai_agent, "UnconstrainedMemory", lambda: None)
+    monkeypatch.setattr(beeai_agent, "_fetch_agent_card", fetch)
+    monkeypatch.setattr(beeai_agent, "_post_construct_fixups", lambda agent, url: agent)
+    monkeypatch.setattr(beeai_agent, "_SUCCESSFUL_CTOR", None)
+
+    beeai_agent._construct_bee_agent(CARD_URL)
+    assert len(fetches) == 1 and len(built) == 1
+    assert beeai_agent._SUCCESSFUL_CTOR is not None
+
+    # The cached path refetches the card; a missing card sends it back to the
+    # ladder instead of building an agent with agent_card=None.
+    cards[0] = None
+    with pytest.raises(RuntimeError):
+        beeai_agent._construct_bee_agent(CARD_URL)
+    assert len(built) == 1
+    assert beeai_agent._SUCCESSFUL_CTOR is None
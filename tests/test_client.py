@@ -0,0 +1,107 @@
+# tests/test_client.py
+import asyncio
+
+import httpx
+import pytest
+from conftest import _reply
+
+from a2a_universal import http
+from a2a_universal._json import dumps, loads
+from a2a_universal.client import A2AClient
+
+BASE = "http://client.test"
+
+
+def _echo(request):
+    return _reply("echo " + request.url.path)
+
+
+def test_asend_uses_the_async_client_registered_for_the_running_loop(mock_server):
+    server = mock_server(BASE, _echo)
+
+    async def main():
+        server.serve_async()
+        try:
+            c = A2AClient(BASE)
+            return await c.asend("ping"), await c.asend("ping", use_jsonrpc=True)
+        finally:
+            await http.aclose_all()
+
+    assert asyncio.run(main()) == ("echo /a2a", "echo /rpc")
+    assert [r.url.path for r in server.seen] == ["/a2a", "/rpc"]
+
+
+def test_asend_raises_on_http_errors(mock_server):
+    server = mock_server(BASE, lambda request: httpx.Response(500))
+
+    async def main():
+        server.serve_async()
+        try:
+            await A2AClient(BASE).asend("ping")
+        finally:
+            await http.aclose_all()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+
+
+def _dict_payload(text, jsonrpc):
+    # The request the client built per call before bodies were pre-encoded.
+    message = {"role": "user", "messageId": "cli", "parts": [{"type": "text", "text": text}]}
+    payload = {"method": "message/send", "params": {"message": message}}
+    return {"jsonrpc": "2.0", "id": "1", **payload} if jsonrpc else payload
+
+
+@pytest.mark.parametrize("use_jsonrpc, path", [(False, "/a2a"), (True, "/rpc")])
+@pytest.mark.parametrize("text", ["ping", 'quote " backslash \\ newline \n', "ünïcode ✓", "__a2a_text__", ""])
+def test_request_body_matches_the_dict_payload(mock_server, use_jsonrpc, path, text):
+    server = mock_server(BASE, _echo)
+    A2AClient(BASE, use_jsonrpc=use_jsonrpc).send(text)
+    A2AClient(BASE).send(text, use_jsonrpc=use_jsonrpc)  # per-call route override
+
+    assert len(server.seen) == 2
+    for request in server.seen:
+        assert request.url.path == path
+        assert request.headers["content-type"] == "application/json"
+        assert loads(request.content) == _dict_payload(text, use_jsonrpc)
+        assert request.content == dumps(_dict_payload(text, use_jsonrpc))
+
+
+def test_send_many_keeps_input_order_and_returns_failures_in_place(mock_server):
+    in_flight, peak = [0], [0]
+
+    async def handler(request):
+        text = loads(request.content)["params"]["message"]["parts"][0]["text"]
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.001 * (10 - int(text[-1])))  # later prompts finish first
+        in_flight[0] -= 1
+        if text == "p3":
+            return httpx.Response(500)
+        return _reply("re " + text)
+
+    server = mock_server(BASE, handler)
+
+    async def main():
+        server.serve_async()
+        try:
+            return await A2AClient(BASE).send_many([f"p{i}" for i in range(8)], max_concurrency=3)
+        finally:
+            await http.aclose_all()
+
+    out = asyncio.run(main())
+    assert [r if isinstance(r, str) else "error" for r in out] == [
+        "re p0", "re p1", "re p2", "error", "re p4", "re p5", "re p6", "re p7",
+    ]
+    assert isinstance(out[3], httpx.HTTPStatusError)
+    assert peak[0] <= 3
+
+
+def test_closing_one_client_leaves_the_shared_pool_open(mock_server):
+    mock_server(BASE, _echo)
+    pool = http.get_client(BASE)
+    with A2AClient(BASE) as c:
+        c.send("ping")
+    A2AClient(BASE).close()
+    assert not pool.is_closed
+    assert A2AClient(BASE).send("ping") == "echo /a2a"
@@ -0,0 +1,86 @@
+# tests/test_config.py
+import dataclasses
+import os
+
+import pytest
+
+from a2a_universal.config import Settings
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    """Empty working directory and no Settings variables in the environment, in any case."""
+    names = {f.name for f in dataclasses.fields(Settings)}
+    for key in list(os.environ):
+        if key.lower() in names:
+            monkeypatch.delenv(key)
+    monkeypatch.chdir(tmp_path)
+    return monkeypatch, tmp_path
+
+
+def test_process_env_overrides_dotenv(env):
+    monkeypatch, tmp = env
+    (tmp / ".env").write_text("AGENT_NAME=from-dotenv\nA2A_PORT=9001\n", encoding="utf-8")
+    monkeypatch.setenv("AGENT_NAME", "from-env")
+
+    s = Settings.from_env()
+    assert s.agent_name == "from-env"
+    assert s.a2a_port == 9001
+    assert s.llm_provider == Settings().llm_provider  # unset -> default
+
+
+def test_env_names_are_case_insensitive(env):
+    monkeypatch, tmp = env
+    (tmp / ".env").write_text("private_adapter_enabled=true\n", encoding="utf-8")
+    monkeypatch.setenv("Llm_Provider", "openai")
+    monkeypatch.setenv("a2a_host", "127.0.0.1")
+
+    s = Settings.from_env()
+    assert (s.llm_provider, s.a2a_host, s.private_adapter_enabled) == ("openai", "127.0.0.1", True)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ('["https://a.example", "https://b.example"]', ["https://a.example", "https://b.example"]),
+    ("https://a.example, https://b.example  # prod", ["https://a.example", "https://b.example"]),
+    ("*", ["*"]),
+    ("", []),
+])
+def test_list_fields_accept_json_and_csv(env, raw, expected):
+    monkeypatch, _ = env
+    monkeypatch.setenv("CORS_ALLOW_ORIGINS", raw)
+    assert Settings.from_env().cors_allow_origins == expected
+
+
+def test_bool_and_auth_scheme_parsers(env):
+    monkeypatch, _ = env
+    monkeypatch.setenv("CORS_ALLOW_CREDENTIALS", "false   # note")
+    monkeypatch.setenv("PRIVATE_ADAPTER_AUTH_SCHEME", "bearer")
+    s = Settings.from_env()
+    assert s.cors_allow_credentials is False
+    assert s.private_adapter_auth_scheme == "BEARER"
+
+
+def test_invalid_value_names_the_variable(env):
+    monkeypatch, _ = env
+    monkeypatch.setenv("A2A_PORT", "eighty")
+    with pytest.raises(ValueError, match="A2A_PORT='eighty'"):
+        Settings.from_env()
+
+
+def test_fast_ignores_the_environment(env):
+    monkeypatch, tmp = env
+    (tmp / ".env").write_text("AGENT_NAME=from-dotenv\n", encoding="utf-8")
+    monkeypatch.setenv("A2A_PORT", "9001")
+    assert Settings.fast() == Settings()
+    assert dataclasses.replace(Settings.fast(), a2a_port=9001).a2a_port == 9001
+
+
+def test_uppercase_attribute_names_and_immutability():
+    s = Settings.fast()
+    assert s.AGENT_NAME == s.agent_name
+    assert s.CORS_ALLOW_ORIGINS == ["*"]
+    for missing in ("NO_SUCH_SETTING", "no_such_setting"):
+        with pytest.raises(AttributeError):
+            getattr(s, missing)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        s.agent_name = "x"
@@ -0,0 +1,17 @@
+# tests/test_crewai_base_tool.py
+from a2a_universal.adapters.crewai_base_tool import A2AHelloTool
+
+
+class _TimedTool(A2AHelloTool):
+    name: str = "timed"
+    timeout: float = 1.0
+
+
+def test_tool_fields_are_assignable_on_subclasses():
+    tool = _TimedTool(base_url="http://other:9000")
+    assert (tool.name, tool.base_url, tool.use_jsonrpc, tool.timeout) == ("timed", "http://other:9000", False, 1.0)
+
+    tool.base_url = "http://localhost:8001"
+    tool.timeout = 2.5
+    assert (tool.base_url, tool.timeout) == ("http://localhost:8001", 2.5)
+    assert _TimedTool().base_url == "http://localhost:8000"
@@ -0,0 +1,66 @@
+# tests/test_examples_common.py
+import httpx
+import pytest
+
+from a2a_universal import examples_common
+
+BASE = "http://probe.test"
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    """Cache readyz results under tmp_path."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv("A2A_BASE", "http://elsewhere.test")  # readyz probes *base*, not A2A_BASE
+    return tmp_path / "a2a"
+
+
+@pytest.fixture
+def probe(mock_server, cache_dir):
+    """Serve a ready /readyz at BASE; yields (request paths seen, cache folder)."""
+    server = mock_server(BASE, lambda request: httpx.Response(200, content=b'{"status":"ready"}'))
+    return server.seen, cache_dir
+
+
+def test_readyz_is_cached_for_ttl_seconds(probe):
+    hits, folder = probe
+    assert examples_common.readyz(BASE) == (200, b'{"status":"ready"}')
+    assert examples_common.readyz(BASE + "/") == (200, b'{"status":"ready"}')
+    assert [r.url.path for r in hits] == ["/readyz"]
+
+    assert examples_common.readyz(BASE, ttl=0) == (200, b'{"status":"ready"}')
+    assert len(hits) == 2
+
+    # One complete cache file, no temp files left behind.
+    (cache,) = folder.iterdir()
+    assert cache.read_bytes() == b'200\n{"status":"ready"}'
+
+
+def test_readyz_cache_write_is_atomic(probe, monkeypatch):
+    hits, folder = probe
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(examples_common.os, "replace", fail_replace)
+    assert examples_common.readyz(BASE) == (200, b'{"status":"ready"}')
+    assert list(folder.iterdir()) == []  # neither a partial cache file nor the temp file
+    assert len(hits) == 1
+
+
+def test_unreachable_server_is_not_cached(mock_server, cache_dir):
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    mock_server(BASE, refuse)
+    assert examples_common.readyz(BASE) is None
+    assert not cache_dir.exists() or list(cache_dir.iterdir()) == []
+
+
+def test_only_ready_responses_are_cached(mock_server, cache_dir):
+    server = mock_server(BASE, lambda request: httpx.Response(200, content=b"{}"))
+    server.replies.append(httpx.Response(503, content=b"{}"))
+    assert examples_common.readyz(BASE) == (503, b"{}")
+    assert examples_common.readyz(BASE) == (200, b"{}")  # 503 was not cached
+    assert examples_common.readyz(BASE) == (200, b"{}")  # served from the cache
+    assert len(server.seen) == 2
@@ -0,0 +1,53 @@
+# tests/test_frameworks.py
+from functools import cache
+
+import pytest
+
+from a2a_universal import frameworks
+from a2a_universal.frameworks import FrameworkBase, build_framework
+from a2a_universal.providers import ProviderBase
+
+
+@pytest.fixture
+def provider():
+    return ProviderBase()
+
+
+def test_build_framework_returns_a_new_instance_per_call(provider, monkeypatch):
+    monkeypatch.setenv("AGENT_FRAMEWORK", "native")
+    first, second = build_framework(provider), build_framework(provider)
+    assert first.id == second.id == "native"
+    assert first is not second
+
+
+@pytest.mark.parametrize("env, fid", [
+    ("native", "native"),
+    ("direct", "native"),
+    ("LG", "langgraph"),
+    ("crew", "crewai"),
+    ("bee.ai", "beeai"),
+    ("no-such-framework", "native"),
+])
+def test_build_framework_follows_agent_framework_between_calls(provider, monkeypatch, env, fid):
+    monkeypatch.setenv("AGENT_FRAMEWORK", "native")
+    assert build_framework(provider).id == "native"
+    monkeypatch.setenv("AGENT_FRAMEWORK", env)
+    assert build_framework(provider).id == fid
+
+
+def test_reset_caches_picks_up_new_plugins(provider, monkeypatch):
+    class Fake(FrameworkBase):
+        id = "fake"
+
+    monkeypatch.setenv("AGENT_FRAMEWORK", "fake")
+    assert build_framework(provider).id == "native"  # caches 'fake' -> native fallback
+
+    monkeypatch.setattr(frameworks, "_discover_entry_points", cache(lambda: {"fake": Fake}))
+    assert build_framework(provider).id == "native"  # resolution is cached until reset
+    frameworks._reset_caches()
+    assert "fake" in frameworks.list_frameworks()
+    assert isinstance(build_framework(provider), Fake)
+
+    monkeypatch.undo()
+    frameworks._reset_caches()
+    assert "fake" not in frameworks.list_frameworks()
@@ -0,0 +1,70 @@
+# tests/test_http.py
+import asyncio
+
+import httpx
+
+from a2a_universal import http
+
+
+def test_sync_clients_are_shared_per_base_url_and_reopened_after_close():
+    try:
+        a = http.get_client("http://reg.test")
+        assert http.get_client("http://reg.test/") is a
+        assert http.get_client("http://other.test") is not a
+
+        http.close_client("http://reg.test/")
+        assert a.is_closed
+        b = http.get_client("http://reg.test")
+        assert b is not a and not b.is_closed
+
+        http.close_all()
+        assert b.is_closed and http.get_client("http://reg.test") is not b
+    finally:
+        http.close_all()
+
+
+def test_set_client_replaces_the_shared_client():
+    mock = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(204)))
+    old = http.get_client("http://reg.test")
+    http.set_client("http://reg.test/", mock)
+    try:
+        assert old.is_closed  # the replaced pool is not leaked
+        assert http.get_client("http://reg.test") is mock
+        assert http.get_client("http://reg.test").get("http://reg.test/x").status_code == 204
+        http.set_client("http://reg.test", mock)  # re-installing the same client keeps it open
+        assert not mock.is_closed
+    finally:
+        http.close_all()
+    assert mock.is_closed
+
+
+def test_async_clients_are_shared_per_event_loop():
+    async def grab():
+        a = http.get_async_client("http://reg.test")
+        b = http.get_async_client("http://reg.test/")
+        other = http.get_async_client("http://other.test")
+        await http.aclose_all()
+        return a, b, other
+
+    a1, b1, other1 = asyncio.run(grab())
+    a2, _, _ = asyncio.run(grab())
+    assert a1 is b1 and a1 is not other1
+    assert a2 is not a1  # a new loop gets its own client
+    assert a1.is_closed and other1.is_closed and a2.is_closed
+
+
+def test_clients_of_finished_loops_are_dropped():
+    async def leak():
+        return http.get_async_client("http://reg.test")
+
+    leaked = asyncio.run(leak())  # never closed by its loop
+
+    async def fresh():
+        client = http.get_async_client("http://reg.test")
+        live = list(http._ASYNC_CLIENTS) == [asyncio.get_running_loop()]
+        await http.aclose_all()
+        return client, live
+
+    client, live = asyncio.run(fresh())
+    assert client is not leaked
+    assert live  # the finished loop's entry was pruned
@@ -0,0 +1,50 @@
+# tests/test_json.py
+import pytest
+
+from a2a_universal._json import dumps, loads, split_around
+from a2a_universal.client import request_envelope
+
+
+def _skill_payload(message_id, skill):
+    # Same shape as the CrewAI A2ATool payload: the prompt sits between fixed values.
+    def encode(text):
+        return dumps({
+            "params": {"message": {"messageId": message_id, "parts": [
+                {"type": "text", "text": text},
+                {"type": "data", "data": skill},
+            ]}}
+        })
+    return encode
+
+
+@pytest.mark.parametrize("message_id, skill", [
+    ("tool", "skill"),
+    ("__a2a_text__", "skill"),
+    ("tool", "__a2a_text__"),
+    ("__a2a_text__", "__a2a_text___"),
+])
+def test_split_around_roundtrip_even_if_fixed_values_look_like_the_marker(message_id, skill):
+    encode = _skill_payload(message_id, skill)
+    head, tail = split_around(encode)
+    for text in ("ping", "__a2a_text__", 'quote " and ünïcode'):
+        assert head + dumps(text) + tail == encode(text)
+
+
+def test_split_around_rejects_encoder_without_slot():
+    with pytest.raises(ValueError):
+        split_around(lambda text: dumps({"fixed": True}))
+
+
+def test_request_envelope_with_marker_like_message_id():
+    head, tail = request_envelope("__a2a_text__")
+    body = loads(head + dumps("hi") + tail)
+    assert body["params"]["message"]["messageId"] == "__a2a_text__"
+    assert body["params"]["message"]["parts"] == [{"type": "text", "text": "hi"}]
+
+
+def test_crewai_payload_envelope_with_marker_like_skill():
+    crewai_tool = pytest.importorskip("a2a_universal.adapters.crewai_tool", reason="crewai not installed")
+    head, tail = crewai_tool._payload_envelope("__a2a_text__", "__a2a_text__")
+    body = loads(head + dumps("hi") + tail)
+    assert body["params"]["message"]["parts"][0]["text"] == "hi"
+    assert body["params"]["message"]["parts"][1]["data"] == "__a2a_text__"
@@ -0,0 +1,55 @@
+# tests/test_langchain_tool.py
+import threading
+
+import httpx
+import pytest
+
+pytest.importorskip("langchain_core", reason="optional dependency not installed in CI")
+
+from a2a_universal.adapters import langchain_tool
+
+
+@pytest.fixture
+def fresh_preflight(monkeypatch):
+    monkeypatch.setattr(langchain_tool, "_PREFLIGHT_EVENT", threading.Event())
+    monkeypatch.setattr(langchain_tool, "_PREFLIGHT_LOCK", threading.Lock())
+
+
+def test_late_preflight_callers_wait_for_the_first_one(fresh_preflight, monkeypatch):
+    in_probe, release = threading.Event(), threading.Event()
+    order = []
+
+    def slow_get(url, timeout):
+        in_probe.set()
+        release.wait(5)
+        order.append("probe done")
+        return httpx.Response(200, content=b'{"framework": "crewai"}')
+
+    monkeypatch.setattr(langchain_tool.httpx, "get", slow_get)
+    first = threading.Thread(target=langchain_tool._preflight_readyz, args=("http://x",))
+    first.start()
+    assert in_probe.wait(5)
+
+    def late():
+        langchain_tool._preflight_readyz("http://x")
+        order.append("late caller returned")
+
+    second = threading.Thread(target=late)
+    second.start()
+    second.join(0.2)
+    assert second.is_alive()  # blocked on the event, not returned early
+
+    release.set()
+    first.join(5)
+    second.join(5)
+    assert order == ["probe done", "late caller returned"]
+
+
+def test_late_preflight_callers_give_up_after_the_timeout(fresh_preflight, monkeypatch):
+    monkeypatch.setattr(langchain_tool, "_PREFLIGHT_WAIT_SEC", 0.05)
+    langchain_tool._PREFLIGHT_LOCK.acquire()  # a first caller that never finishes
+    try:
+        langchain_tool._preflight_readyz("http://x")
+        assert not langchain_tool._PREFLIGHT_EVENT.is_set()
+    finally:
+        langchain_tool._PREFLIGHT_LOCK.release()
@@ -50,3 +50,39 @@ def test_langgraph_a2a_node(monkeypatch):
     assert isinstance(res, dict)
     assert "messages" in res
     assert "Hello" in res["messages"][-1].content
+
+
+def test_langgraph_a2a_node_ainvoke_uses_async_client(monkeypatch):
+    """app.ainvoke awaits the node's async path (A2AClient.asend), not the sync send."""
+    import asyncio
+
+    node = A2AAgentNode(base_url="http://localhost:8000", retries=0)
+
+    async def fake_asend(text, use_jsonrpc=False):
+        return f"Hello async, you said: {text}"
+
+    def fail_send(text, use_jsonrpc=False):
+        raise AssertionError("sync send used from ainvoke")
+
+    monkeypatch.setattr(node.client, "asend", fake_asend)
+    monkeypatch.setattr(node.client, "send", fail_send)
+
+    sg = StateGraph(MessagesState)
+    sg.add_node("a2a", node)
+    sg.add_edge("__start__", "a2a")
+    sg.add_edge("a2a", END)
+    app = sg.compile()
+
+    res = asyncio.run(app.ainvoke({"messages": [HumanMessage(content="ping")]}))
+    assert res["messages"][-1].content == "Hello async, you said: ping"
+
+
+def test_langgraph_a2a_node_reads_messages_edited_in_place():
+    """The user text is re-read on every call, so in-place edits by a reducer are seen."""
+    node = A2AAgentNode(base_url="http://localhost:8000", retries=0)
+    messages = [{"role": "user", "content": "first"}]
+    state = {"messages": messages}
+    assert node._user_text(state) == "first"
+
+    messages[-1]["content"] = "edited"
+    assert node._user_text(state) == "edited"
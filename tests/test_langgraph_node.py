@@ -0,0 +1,132 @@
+# tests/test_langgraph_node.py
+import asyncio
+import importlib
+import sys
+
+import httpx
+import pytest
+from conftest import _reply
+
+from a2a_universal import http
+
+BASE = "http://node.test"
+
+
+def _hello(request):
+    return _reply("Hello, you said: " + ("ping" if b'"ping"' in request.read() else "?"))
+
+
+@pytest.fixture
+def server(mock_server):
+    """BASE answering "Hello, you said: ping" to pings."""
+    return mock_server(BASE, _hello)
+
+
+@pytest.fixture
+def no_langchain(monkeypatch):
+    """Make langchain/langgraph unimportable and drop cached adapter modules."""
+    for name in ("langchain_core", "langchain", "langgraph"):
+        monkeypatch.setitem(sys.modules, name, None)
+    for name in list(sys.modules):
+        if name.startswith("a2a_universal.adapters."):
+            monkeypatch.delitem(sys.modules, name)
+
+
+def test_a2anode_imports_and_runs_without_langchain(no_langchain, server):
+    A2ANode = importlib.import_module("a2a_universal.adapters.langgraph_node").A2ANode
+
+    out = A2ANode(base_url=BASE)({"input": "ping", "other": 1})
+
+    assert out == {"input": "ping", "other": 1, "a2a_reply": "Hello, you said: ping"}
+    assert server.seen[0].url.path == "/a2a"
+    assert "langchain_core" not in {m for m in sys.modules if sys.modules[m] is not None}
+
+
+def test_a2anode_retries_transient_errors_then_raises_final_ones(server, monkeypatch):
+    from a2a_universal.adapters import _common
+    from a2a_universal.adapters.langgraph_node import A2ANode
+
+    monkeypatch.setattr(_common.time, "sleep", lambda s: None)
+    seen, replies = server.seen, server.replies
+    node = A2ANode(base_url=BASE, use_jsonrpc=True)
+
+    replies.append(httpx.Response(503))
+    assert node({"input": "ping"})["a2a_reply"] == "Hello, you said: ping"
+    assert len(seen) == 2 and seen[-1].url.path == "/rpc"
+
+    replies.append(httpx.Response(400))
+    with pytest.raises(httpx.HTTPStatusError):
+        node({"input": "ping"})
+    assert len(seen) == 3
+
+
+def test_send_with_retries_reports_outcome(server, monkeypatch):
+    from a2a_universal.adapters import _common
+    from a2a_universal.client import shared_client
+
+    monkeypatch.setattr(_common.time, "sleep", lambda s: None)
+    seen, replies = server.seen, server.replies
+    client = shared_client(BASE)
+    log = _common.logging.getLogger("test")
+
+    replies.extend([httpx.Response(502), httpx.Response(503)])
+    out = _common.send_with_retries(client, "ping", use_jsonrpc=False, retries=2, retry_cap_ms=10, log=log)
+    assert out == _common.Outcome("Hello, you said: ping", None, None, 3)
+    assert len(seen) == 3
+
+    replies.extend([httpx.Response(503)] * 2)
+    out = _common.send_with_retries(client, "ping", use_jsonrpc=False, retries=1, retry_cap_ms=10, log=log)
+    assert out.reply is None and out.attempts == 2
+    assert isinstance(out.error, httpx.HTTPStatusError)
+
+
+def test_asend_with_retries_and_a2anode_acall(server, monkeypatch):
+    from a2a_universal.adapters import _common
+    from a2a_universal.adapters.langgraph_node import A2ANode
+    from a2a_universal.client import shared_client
+
+    async def no_sleep(s):
+        pass
+
+    monkeypatch.setattr(_common.asyncio, "sleep", no_sleep)
+    server.replies.extend([httpx.Response(503), httpx.Response(404)])
+
+    async def main():
+        server.serve_async()
+        try:
+            out = await _common.asend_with_retries(
+                shared_client(BASE), "ping", use_jsonrpc=False, retries=3, retry_cap_ms=10,
+                log=_common.logging.getLogger("test"),
+            )
+            state = await A2ANode(base_url=BASE).acall({"input": "ping"})
+            return out, state
+        finally:
+            await http.aclose_all()
+
+    out, state = asyncio.run(main())
+    # 503 is retried, 404 is final.
+    assert out.reply is None and out.attempts == 2
+    assert out.error.response.status_code == 404
+    assert state == {"input": "ping", "a2a_reply": "Hello, you said: ping"}
+    assert len(server.seen) == 3
+
+
+def test_a2aagentnode_call_and_acall_without_langgraph(server, monkeypatch):
+    pytest.importorskip("langchain_core", reason="optional dependency not installed in CI")
+    monkeypatch.setitem(sys.modules, "langgraph", None)
+    monkeypatch.delitem(sys.modules, "a2a_universal.adapters.langgraph_agent", raising=False)
+    from a2a_universal.adapters.langgraph_agent import A2AAgentNode
+
+    node = A2AAgentNode(base_url=BASE, retries=0)
+    out = node({"messages": [{"role": "user", "content": "ping"}]})
+    assert out["messages"][-1].content == "Hello, you said: ping"
+
+    async def main():
+        server.serve_async()
+        try:
+            return await node.acall({"messages": [{"role": "user", "content": "ping"}]})
+        finally:
+            await http.aclose_all()
+
+    assert asyncio.run(main())["messages"][-1].content == "Hello, you said: ping"
+    assert len(server.seen) == 2
@@ -32,3 +32,23 @@ def test_a2a_roundtrip():
     finally:
         if isinstance(proc, subprocess.Popen):
             proc.terminate()
+
+
+def test_agent_card_etag_and_cache_control():
+    from fastapi.testclient import TestClient
+
+    from a2a_universal.server import app
+
+    client = TestClient(app)
+    r = client.get("/.well-known/agent-card.json")
+    assert r.status_code == 200 and r.json()["preferredTransport"] == "JSONRPC"
+    etag = r.headers["etag"]
+    assert r.headers["cache-control"].startswith("max-age=")
+
+    r = client.get("/.well-known/agent-card.json", headers={"If-None-Match": etag})
+    assert r.status_code == 304 and r.content == b"" and r.headers["etag"] == etag
+    for header in (f'"other", {etag}', f"W/{etag}", f' "x",W/{etag} ', "*"):
+        assert client.get("/.well-known/agent-card.json", headers={"If-None-Match": header}).status_code == 304, header
+    # Substrings and unrelated tags are not matches.
+    for header in ('"other"', etag[:-1] + 'x"', f'"x{etag[1:]}', ""):
+        assert client.get("/.well-known/agent-card.json", headers={"If-None-Match": header}).status_code == 200, header